@@ -1,7 +1,7 @@
 #/*=====Start Change Task 2=====*/
 
 import csv
-from eightpuzzle import (EightPuzzleState)
+import eightpuzzle
 
 def load_csv(filename):
 
@@ -11,7 +11,9 @@ def load_csv(filename):
         for row in csv_reader:
             if len(row) == 9:
                 puzzle = [int(cell) for cell in row]
-                puzzle_data.append(puzzle)
+                # rows that are not a permutation of 0-8 are not puzzles
+                if sorted(puzzle) == list(range(9)):
+                    puzzle_data.append(puzzle)
     return puzzle_data
 
 
@@ -19,7 +21,7 @@ def create_puzzles_from_csv(puzzle_data):
 
     puzzles = []
     for puzzle_config in puzzle_data:
-        puzzle = EightPuzzleState(puzzle_config)
+        puzzle = eightpuzzle.EightPuzzleState(puzzle_config)
         puzzles.append(puzzle)
     return puzzles
 
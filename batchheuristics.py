@@ -0,0 +1,70 @@
+# batchheuristics.py
+# ------------------
+# h1test-h4test (see search.py) for many boards in one call.
+#
+# With numpy, boards come as an (N, size) integer array, one row-major board
+# per row with 0 for the blank, and each heuristic is a handful of array
+# lookups over all N boards at once.  The tables are those of
+# search.GoalTables, so any goal and any width x width board work.  Without
+# numpy, heuristicValues falls back to calling the tests one state at a time.
+
+import search
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NAMES = ('h1', 'h2', 'h3', 'h4')
+
+_arrayTablesCache = {}
+
+def arrayTables(goal):
+    """
+      The misplaced, euclidean, manhattan and outOfLine tables of
+    search.goalTables(goal) as numpy arrays indexed [tile, index], cached
+    per goal.
+    """
+    key = tuple(goal.numbers())
+    if key not in _arrayTablesCache:
+        tables = search.goalTables(goal)
+        _arrayTablesCache[key] = (numpy.array(tables.misplaced, dtype=numpy.int64),
+                                  numpy.array(tables.euclidean, dtype=numpy.float64),
+                                  numpy.array(tables.manhattan, dtype=numpy.int64),
+                                  numpy.array(tables.outOfLine, dtype=numpy.int64))
+    return _arrayTablesCache[key]
+
+def boardArray(states):
+    "An (N, size) uint8 array of the boards of a list of states."
+    return numpy.array([state.numbers() for state in states], dtype=numpy.uint8)
+
+def _columnSum(table, boards):
+    # added one column at a time, in board order, so that the floating-point
+    # sums of h2 match h2test exactly
+    total = table[boards[:, 0], 0]
+    for index in range(1, boards.shape[1]):
+        total = total + table[boards[:, index], index]
+    return total
+
+def batchHeuristics(boards, goal):
+    """
+      Returns h1, h2, h3 and h4 of every row of 'boards', an (N, size) array,
+    as four arrays of length N.  h2 is float; the others are integers.
+    """
+    misplaced, euclidean, manhattan, outOfLine = arrayTables(goal)
+    boards = numpy.asarray(boards, dtype=numpy.intp)
+    return (_columnSum(misplaced, boards) - 1,
+            _columnSum(euclidean, boards),
+            _columnSum(manhattan, boards),
+            _columnSum(outOfLine, boards))
+
+def heuristicValues(states, goal):
+    """
+      Returns a dict from each of NAMES to the list of that heuristic's
+    values for 'states', vectorised if numpy is available.
+    """
+    if numpy is not None:
+        arrays = batchHeuristics(boardArray(states), goal)
+        return dict([(name, values.tolist()) for name, values in zip(NAMES, arrays)])
+    tests = (search.h1test, search.h2test, search.h3test, search.h4test)
+    return dict([(name, [test(state, goal) for state in states]) for name, test in zip(NAMES, tests)])
@@ -0,0 +1,220 @@
+# benchmarks.py
+# -------------
+# Timing harnesses for the search code.  Run one of them with
+#
+#   python benchmarks.py <name>
+#
+# where <name> is one of the keys of BENCHMARKS below.
+
+import sys
+import time
+import random
+import util
+import search
+import eightpuzzle
+import automate
+import heuristictables
+import patterndb
+import movepruning
+
+def randomPuzzles(num, moves, seed=0):
+    "Returns 'num' random eight puzzles, 'moves' random moves from the goal."
+    random.seed(seed)
+    return [eightpuzzle.createRandomEightPuzzle(moves) for i in range(num)]
+
+def queueUniformCostSearch(problem, frontier):
+    """
+      A bare uniform cost search over states, using the given priority queue
+    with update() as decrease-key.  Returns the number of expanded states.
+    """
+    frontier.update(problem.getStartState(), 0)
+    costs = {problem.getStartState(): 0}
+    expanded = set()
+    while not frontier.isEmpty():
+        state = frontier.pop()
+        if state in expanded:
+            continue
+        expanded.add(state)
+        if problem.isGoalState(state):
+            break
+        for succState, succAction, succCost in problem.getSuccessors(state):
+            newCost = costs[state] + succCost
+            if succState not in expanded and newCost < costs.get(succState, newCost + 1):
+                costs[succState] = newCost
+                frontier.update(succState, newCost)
+    return len(expanded)
+
+def benchmarkPriorityQueues(num=20, moves=20):
+    """
+      Uniform cost search throughput on random puzzles with the linear-scan
+    util.PriorityQueue.update and with util.KeyedPriorityQueue.
+    """
+    puzzles = randomPuzzles(num, moves)
+    print("UCS on %d random %d-move puzzles" % (num, moves))
+    print("------------------------------------------------------------")
+    for name, queueClass in [('PriorityQueue', util.PriorityQueue),
+                             ('KeyedPriorityQueue', util.KeyedPriorityQueue)]:
+        expanded = 0
+        start = time.time()
+        for puzzle in puzzles:
+            problem = eightpuzzle.EightPuzzleSearchProblem(puzzle)
+            expanded += queueUniformCostSearch(problem, queueClass())
+        elapsed = time.time() - start
+        print("%-20s %8d expansions %8.2f s %10.0f expansions/s" % (name, expanded, elapsed, expanded / elapsed))
+
+    expanded = 0
+    start = time.time()
+    for puzzle in puzzles:
+        expanded += search.uniformCostSearch(eightpuzzle.EightPuzzleSearchProblem(puzzle))[3]
+    elapsed = time.time() - start
+    print("%-20s %8d expansions %8.2f s %10.0f expansions/s" % ('uniformCostSearch', expanded, elapsed, expanded / elapsed))
+    print()
+
+def benchmarkBreadthFirstSweep():
+    """
+      A layered breadth-first sweep of all 181,440 eight puzzle states,
+    reporting each layer's size as it is reached.
+    """
+    goal = eightpuzzle.EightPuzzleState([0, 1, 2, 3, 4, 5, 6, 7, 8])
+    problem = eightpuzzle.EightPuzzleSearchProblem(goal)
+    print("Breadth-first sweep from the goal")
+    print("------------------------------------------------------------")
+    states = 0
+    start = time.time()
+    for layer in search.breadthFirstLayers(problem):
+        states += len(layer)
+        print("depth %2d: %6d states" % (layer[0].depth, len(layer)))
+    elapsed = time.time() - start
+    print("%d states in %.2f s" % (states, elapsed))
+    print()
+
+def benchmarkTableHeuristics(num=20, moves=200):
+    """
+      Nodes expanded and time taken by A* with Manhattan distance (h3), the
+    table-backed linear conflict heuristic and the walking distance, on the
+    puzzles of scenarios.csv and on 'num' random deep puzzles.
+    """
+    goal = eightpuzzle.EightPuzzleState([0, 1, 2, 3, 4, 5, 6, 7, 8])
+    heuristics = [('h3 manhattan', search.ManhattanHeuristic(goal)),
+                  ('linear conflict', heuristictables.LinearConflictTableHeuristic(goal)),
+                  ('walking distance', heuristictables.WalkingDistanceHeuristic(goal))]
+    puzzleSets = [('scenarios.csv', automate.create_puzzles_from_csv(automate.load_csv('scenarios.csv'))),
+                  ('%d random %d-move' % (num, moves), randomPuzzles(num, moves))]
+    for setName, puzzles in puzzleSets:
+        print("A* on %s puzzles" % setName)
+        print("------------------------------------------------------------")
+        baseline = None
+        for name, heuristic in heuristics:
+            explored = 0
+            start = time.time()
+            for puzzle in puzzles:
+                explored += search.aStarSearch(eightpuzzle.EightPuzzleSearchProblem(puzzle), heuristic)[3]
+            elapsed = time.time() - start
+            if baseline is None:
+                baseline = explored
+            print("%-20s %8d nodes %6.1f%% of h3 %8.2f s" % (name, explored, 100.0 * explored / baseline, elapsed))
+        print()
+
+def benchmarkPatternCompression(num=20, moves=200):
+    """
+      Table memory against nodes expanded by A* on 'num' random deep puzzles,
+    for the eight puzzle's 4-4 pattern databases stored one byte or four bits
+    per entry, min-compressed by various factors, with and without diagonal
+    reflection.
+    """
+    goal = eightpuzzle.EightPuzzleState([0, 1, 2, 3, 4, 5, 6, 7, 8])
+    partition = patterndb.PARTITIONS[3]['4-4']
+    puzzles = randomPuzzles(num, moves)
+    print("A* with 4-4 pattern databases on %d random %d-move puzzles" % (num, moves))
+    print("------------------------------------------------------------")
+    for storage, factor in [('byte', 1), ('nibble', 1), ('byte', 2), ('nibble', 2),
+                            ('nibble', 4), ('nibble', 8), ('nibble', 16)]:
+        for reflect in (False, True):
+            heuristic = patterndb.AdditivePatternHeuristic(goal, partition, storage=storage,
+                                                          factor=factor, reflect=reflect)
+            memory = sum([len(database.table) for database in heuristic.databases])
+            explored = 0
+            start = time.time()
+            for puzzle in puzzles:
+                explored += search.aStarSearch(eightpuzzle.EightPuzzleSearchProblem(puzzle), heuristic)[3]
+            elapsed = time.time() - start
+            name = '%s x%d%s' % (storage, factor, ' reflected' if reflect else '')
+            print("%-20s %8d bytes %8d nodes %8.2f s" % (name, memory, explored, elapsed))
+    print()
+
+def benchmarkMaxHeuristic(num=20, moves=200):
+    """
+      IDA* on 'num' random deep puzzles with the max of h3, h4 and the table
+    heuristics, followed by the combinator's per-component accounting.
+    """
+    goal = eightpuzzle.EightPuzzleState([0, 1, 2, 3, 4, 5, 6, 7, 8])
+    heuristic = search.MaxHeuristic(
+        [eightpuzzle.HEURISTICS['h3'], eightpuzzle.HEURISTICS['h4'],
+         heuristictables.LinearConflictTableHeuristic(goal), heuristictables.WalkingDistanceHeuristic(goal)],
+        ['h3', 'h4', 'linear conflict', 'walking distance'])
+    puzzles = randomPuzzles(num, moves)
+    print("IDA* with the max of h3, h4, linear conflict and walking distance on %d random %d-move puzzles" % (num, moves))
+    print("------------------------------------------------------------")
+    explored = 0
+    start = time.time()
+    for puzzle in puzzles:
+        explored += search.idaStarSearch(eightpuzzle.EightPuzzleSearchProblem(puzzle), heuristic)[3]
+    print("%d nodes in %.2f s" % (explored, time.time() - start))
+    heuristic.report()
+    print()
+
+class CountingHeuristic:
+    """
+      Wraps a TableHeuristic and counts the nodes a search generates: IDA*
+    evaluates the start once and every child it generates by childValue.
+    """
+    def __init__(self, heuristic):
+        self.heuristic = heuristic
+        self.generated = 0
+
+    def __call__(self, state, problem=None):
+        self.generated += 1
+        return self.heuristic(state, problem)
+
+    def childValue(self, value, state, move):
+        self.generated += 1
+        return self.heuristic.childValue(value, state, move)
+
+def benchmarkDuplicatePruning(num=10, moves=200):
+    """
+      IDA* with Manhattan distance on 'num' random fifteen puzzles,
+    'moves' random moves from the goal, skipping only the inverse of the
+    previous move and with the movepruning duplicate automaton as well.
+    Reports the nodes expanded and generated over all iterations.
+    """
+    random.seed(0)
+    puzzles = [eightpuzzle.createRandomPuzzle(4, moves) for i in range(num)]
+    goal = eightpuzzle.puzzleClass(4)(list(range(16)))
+    heuristic = search.ManhattanHeuristic(goal)
+    #load the stored patterns before timing
+    movepruning.getDuplicateAutomaton(4)
+    print("IDA* with Manhattan distance on %d random %d-move fifteen puzzles" % (num, moves))
+    print("------------------------------------------------------------")
+    for name, prune in [('inverse moves', False), ('duplicate automaton', True)]:
+        counter = CountingHeuristic(heuristic)
+        expanded = 0
+        start = time.time()
+        for puzzle in puzzles:
+            problem = eightpuzzle.EightPuzzleSearchProblem(puzzle)
+            expanded += search.idaStarSearch(problem, counter, pruneDuplicates=prune)[3]
+        print("%-20s %10d expanded %10d generated %8.2f s" % (name, expanded, counter.generated, time.time() - start))
+    print()
+
+BENCHMARKS = {
+    'queues': benchmarkPriorityQueues,
+    'sweep': benchmarkBreadthFirstSweep,
+    'heuristics': benchmarkTableHeuristics,
+    'compression': benchmarkPatternCompression,
+    'max': benchmarkMaxHeuristic,
+    'pruning': benchmarkDuplicatePruning,
+}
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or sorted(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
@@ -0,0 +1,104 @@
+# distancedb.py
+# -------------
+# Exact distances to the goal for every reachable eight puzzle.
+#
+# A retrograde breadth-first search from the goal visits all 181,440
+# reachable configurations and records each one's distance in a byte array
+# indexed by its rank (see ranking.py).  The array is saved to a file and
+# memory-mapped when loaded, so it is shared between processes and costs
+# nothing to open.  With it, optimal solving is search.greedyDescentSearch:
+# a walk down the distances with no search at all.
+#
+# There is one table per place of the blank in the goal, for the goal
+# eightpuzzle.canonicalGoal(3, blank); EightPuzzleSearchProblem relabels
+# any other goal with the blank in that place to it.
+
+import os
+import mmap
+import util
+import search
+import ranking
+import eightpuzzle
+
+UNREACHABLE = 255
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables', 'eightpuzzle.dist')
+
+def distancePath(goalBlank=0):
+    "The file of the table for goals with the blank at index 'goalBlank'."
+    if goalBlank == 0:
+        return DEFAULT_PATH
+    return os.path.join(os.path.dirname(DEFAULT_PATH), 'eightpuzzle-%d.dist' % goalBlank)
+
+def buildDistanceTable(goalBlank=0):
+    """
+      Returns a bytearray holding, at each rank, the optimal number of moves
+    from that configuration to the canonical goal with the blank at index
+    'goalBlank'.
+    """
+    goal = eightpuzzle.EightPuzzleState(eightpuzzle.canonicalGoal(3, goalBlank))
+    problem = search.BackwardProblem(eightpuzzle.EightPuzzleSearchProblem(goal, goal))
+    table = bytearray([UNREACHABLE]) * problem.getStateSpaceSize()
+    for layer in search.breadthFirstLayers(problem):
+        for node in layer:
+            table[node.state.rank()] = node.depth
+    return table
+
+class DistanceDatabase:
+    """
+      The distance table of buildDistanceTable behind a heuristic interface:
+    database(state, problem) is the exact cost from state to the goal, so
+    it can be given to search.aStarSearch, or to search.greedyDescentSearch
+    to solve without searching, for problems whose goal has its blank at
+    index goalBlank.
+    """
+    def __init__(self, table, goalBlank=0):
+        self.table = table
+        self.goalBlank = goalBlank
+
+    def distance(self, state):
+        "The optimal number of moves from 'state' to the goal."
+        return self.table[state.rank()]
+
+    def __call__(self, state, problem=None):
+        return self.table[state.rank()]
+
+    def solve(self, state, goal=None):
+        """
+          Returns an optimal list of moves from 'state' to 'goal', which
+        defaults to the canonical goal and must have its blank at goalBlank.
+        Raises search.UnsolvablePuzzle if the goal cannot be reached.
+        """
+        if goal is None:
+            goal = eightpuzzle.EightPuzzleState(eightpuzzle.canonicalGoal(3, self.goalBlank))
+        if goal.blank != self.goalBlank:
+            raise Exception("The goal's blank is not at index %d" % self.goalBlank)
+        problem = eightpuzzle.EightPuzzleSearchProblem(state, goal)
+        return search.greedyDescentSearch(problem, self)[0]
+
+    def save(self, path=DEFAULT_PATH):
+        util.writeAtomically(path, self.table)
+
+def loadDistanceDatabase(path=DEFAULT_PATH, goalBlank=0):
+    """
+      Memory-maps a table written by DistanceDatabase.save, which must have
+    an entry for every reachable configuration.
+    """
+    with open(path, 'rb') as file:
+        table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(table) != ranking.numStates(3):
+        raise Exception("%s has %d entries rather than %d; delete it to rebuild it"
+                        % (path, len(table), ranking.numStates(3)))
+    return DistanceDatabase(table, goalBlank)
+
+def getDistanceDatabase(path=None, goalBlank=0):
+    """
+      Loads the table for goals with the blank at 'goalBlank' from 'path'
+    (by default distancePath(goalBlank)), building and saving it first if it
+    is missing.
+    """
+    if path is None:
+        path = distancePath(goalBlank)
+    if not os.path.exists(path):
+        DistanceDatabase(buildDistanceTable(goalBlank), goalBlank).save(path)
+    return loadDistanceDatabase(path, goalBlank)
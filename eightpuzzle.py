@@ -12,30 +12,96 @@
 # Pieter Abbeel (pabbeel@cs.berkeley.edu).
 
 
+import math
+import util
 import search
 import random
+import ranking
 import statistics
 import automate
+import movepruning
+import batchheuristics
 # Module Classes
 
-class EightPuzzleState:
+INVERSE_MOVES = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'}
+
+def tileBits( size ):
     """
-    The Eight Puzzle is described in the course textbook on
-    page 64.
+      Bits per tile in a packed board of 'size' cells: 4 up to the fifteen
+    puzzle, 5 for the 24 puzzle.
+    """
+    return max( 4, (size - 1).bit_length() )
 
-    This class defines the mechanics of the puzzle itself.  The
-    task of recasting this puzzle as a search problem is left to
-    the EightPuzzleSearchProblem class.
+def packNumbers( numbers, bits=4 ):
     """
+      Packs a list of tiles into a single integer, 'bits' bits per tile,
+    with the tile at index i stored in bits bits*i..bits*i+bits-1.
+    """
+    board = 0
+    for index, tile in enumerate( numbers ):
+        board |= tile << (bits * index)
+    return board
+
+def zobristKeys( size ):
+    """
+      Zobrist keys for a board of 'size' cells: keys[tile][index] is a fixed
+    random 61-bit number for each tile and cell, and 0 for the blank, whose
+    place follows from the tiles'.  A board's hash is the XOR of the keys of
+    its tiles, so moving a tile changes it by two XORs.
+    """
+    generator = util.FixedRandom().random
+    keys = [(0,) * size]
+    for tile in range( 1, size ):
+        keys.append( tuple( [generator.getrandbits( 61 ) for index in range( size )] ) )
+    return tuple( keys )
+
+def canonicalGoal( width, blank ):
+    """
+      The goal every goal with the blank at index 'blank' is relabeled to
+    (see EightPuzzleSearchProblem): the tiles 1, 2, ... in row-major order
+    around the blank, so 0, 1, 2, ... for blank 0.  On even widths with the
+    blank in an odd row the last two tiles are swapped, which keeps the goal
+    among the configurations that ranking.py ranks.
+
+    >>> canonicalGoal(3, 4)
+    [1, 2, 3, 4, 0, 5, 6, 7, 8]
+    """
+    tiles = list( range( 1, width * width ) )
+    if ranking.tileParity( blank, width ):
+        tiles[-2], tiles[-1] = tiles[-1], tiles[-2]
+    tiles.insert( blank, 0 )
+    return tiles
+
+class SlidingPuzzleState:
+    """
+      A sliding puzzle on a width x width board: the eight puzzle, fifteen
+    puzzle, 24 puzzle and so on.
+
+    The board's geometry is held by one subclass per width (see puzzleClass):
+    its width, size and bits per tile, the legal moves and move targets of
+    each blank index, and the packed goal.  SlidingPuzzleState(numbers)
+    returns an instance of the subclass for len(numbers) cells.
+
+    Each state carries the Zobrist hash of its board (see zobristKeys) in
+    'zobrist', updated rather than recomputed by result(), which makes
+    hashing a slot read and lets == reject most unequal states by hash.
+    """
+    __slots__ = ('board', 'blank', 'zobrist')
+    width = None
+
+    def __new__( cls, numbers ):
+        if cls.width is None:
+            cls = puzzleClass( math.isqrt( len( numbers ) ) )
+        return object.__new__( cls )
 
     def __init__( self, numbers ):
 
         """
-          Constructs a new eight puzzle from an ordering of numbers.
+          Constructs a new puzzle from an ordering of numbers.
 
-        numbers: a list of integers from 0 to 8 representing an
-          instance of the eight puzzle.  0 represents the blank
-          space.  Thus, the list
+        numbers: a list of the integers from 0 to width * width - 1
+          representing an instance of the puzzle.  0 represents the
+          blank space.  Thus, the list
 
             [1, 0, 2, 3, 4, 5, 6, 7, 8]
 
@@ -48,18 +114,97 @@ class EightPuzzleState:
             | 6 | 7 | 8 |
             ------------
 
-        The configuration of the puzzle is stored in a 2-dimensional
-        list (a list of lists) 'cells'.
+        The configuration of the puzzle is packed into a single integer
+        'board', 'bits' bits per tile in row-major order, and the index of
+        the blank is kept in 'blank'.  The 2-dimensional list 'cells' is
+        available as a read-only view.
         """
-        self.cells = []
-        numbers = numbers[:] # Make a copy so as not to cause side-effects.
-        numbers.reverse()
-        for row in range( 3 ):
-            self.cells.append( [] )
-            for col in range( 3 ):
-                self.cells[row].append( numbers.pop() )
-                if self.cells[row][col] == 0:
-                    self.blankLocation = row, col
+        self.board = packNumbers( numbers, self.bits )
+        self.blank = list( numbers ).index( 0 )
+        self.zobrist = self.hashBoard( self.board )
+
+    @classmethod
+    def fromBoard( cls, board, blank, zobrist=None ):
+        """
+          Builds a state directly from a packed board and its blank index,
+        and its Zobrist hash if known.
+        """
+        state = object.__new__( cls )
+        state.board = board
+        state.blank = blank
+        state.zobrist = cls.hashBoard( board ) if zobrist is None else zobrist
+        return state
+
+    @classmethod
+    def hashBoard( cls, board ):
+        "The Zobrist hash of a packed board, computed from scratch."
+        keys, bits, mask = cls.zobristKeys, cls.bits, cls.mask
+        zobrist = 0
+        for index in range( cls.size ):
+            zobrist ^= keys[board & mask][index]
+            board >>= bits
+        return zobrist
+
+    def __reduce__( self ):
+        """
+          Pickles and copies a state as its numbers, rebuilt through
+        SlidingPuzzleState, since the per-width classes are made at run time
+        and __new__ needs the numbers.
+
+        >>> import pickle, copy
+        >>> state = EightPuzzleState([1, 0, 2, 3, 4, 5, 6, 7, 8])
+        >>> copied = pickle.loads(pickle.dumps(state))
+        >>> copied == state, type(copied).__name__, copy.copy(state) == copy.deepcopy(state) == state
+        (True, 'EightPuzzleState', True)
+        >>> state = SlidingPuzzleState([4, 1, 2, 3, 0, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
+        >>> copied = pickle.loads(pickle.dumps(state))
+        >>> copied == state, copied.width, copy.copy(state) == copy.deepcopy(state) == state
+        (True, 4, True)
+        """
+        return (SlidingPuzzleState, (self.numbers(),))
+
+    def tileAt( self, index ):
+        "Returns the tile at the given row-major index."
+        return (self.board >> (self.bits * index)) & self.mask
+
+    def numbers( self ):
+        "Returns the tiles as a flat row-major list, as passed to the constructor."
+        board, bits, mask = self.board, self.bits, self.mask
+        return [(board >> (bits * index)) & mask for index in range( self.size )]
+
+    def isSolvable( self ):
+        """
+          True if the goal can be reached from this configuration: half of all
+        permutations of the tiles cannot.  See ranking.puzzleParity.
+        """
+        return ranking.isSolvable(self.numbers(), self.width)
+
+    def rank( self ):
+        """
+          Returns the dense index of this configuration among the (width^2)!/2
+        configurations reachable from the goal.  See ranking.py.
+
+        >>> EightPuzzleState.unrank(EightPuzzleState([1, 0, 2, 3, 4, 5, 6, 7, 8]).rank()).numbers()
+        [1, 0, 2, 3, 4, 5, 6, 7, 8]
+        """
+        return ranking.rankBoard( self.board, self.blank, self.width, self.bits )
+
+    @classmethod
+    def unrank( cls, rank ):
+        "Builds the configuration with the given rank."
+        return cls( ranking.unrankPuzzle( rank, cls.width ) )
+
+    @property
+    def cells( self ):
+        "The configuration as a fresh width x width list of lists."
+        numbers = self.numbers()
+        width = self.width
+        return [numbers[row:row + width] for row in range( 0, self.size, width )]
+
+    @property
+    def blankLocation( self ):
+        "The (row, col) of the blank."
+        return divmod( self.blank, self.width )
 
     def isGoal( self ):
         """
@@ -79,13 +224,7 @@ class EightPuzzleState:
         >>> EightPuzzleState([1, 0, 2, 3, 4, 5, 6, 7, 8]).isGoal()
         False
         """
-        current = 0
-        for row in range( 3 ):
-            for col in range( 3 ):
-                if current != self.cells[row][col]:
-                    return False
-                current += 1
-        return True
+        return self.board == self.goalBoard
 
     def legalMoves( self ):
         """
@@ -97,87 +236,62 @@ class EightPuzzleState:
         >>> EightPuzzleState([0, 1, 2, 3, 4, 5, 6, 7, 8]).legalMoves()
         ['down', 'right']
         """
-        moves = []
-        row, col = self.blankLocation
-        if(row != 0):
-            moves.append('up')
-        if(row != 2):
-            moves.append('down')
-        if(col != 0):
-            moves.append('left')
-        if(col != 2):
-            moves.append('right')
-        return moves
+        return list( self.legalMoveTable[self.blank] )
 
     def result(self, move):
         """
-          Returns a new eightPuzzle with the current state and blankLocation
-        updated based on the provided move.
+          Returns a new puzzle of the same class with the current state and
+        blankLocation updated based on the provided move.
 
         The move should be a string drawn from a list returned by legalMoves.
-        Illegal moves will raise an exception, which may be an array bounds
-        exception.
+        Illegal moves will raise an exception.
 
         NOTE: This function *does not* change the current object.  Instead,
         it returns a new object.
         """
-        row, col = self.blankLocation
-        if(move == 'up'):
-            newrow = row - 1
-            newcol = col
-        elif(move == 'down'):
-            newrow = row + 1
-            newcol = col
-        elif(move == 'left'):
-            newrow = row
-            newcol = col - 1
-        elif(move == 'right'):
-            newrow = row
-            newcol = col + 1
-        else:
-            raise "Illegal Move"
-
-        # Create a copy of the current eightPuzzle
-        newPuzzle = EightPuzzleState([0, 0, 0, 0, 0, 0, 0, 0, 0])
-        newPuzzle.cells = [values[:] for values in self.cells]
-        # And update it to reflect the move
-        newPuzzle.cells[row][col] = self.cells[newrow][newcol]
-        newPuzzle.cells[newrow][newcol] = self.cells[row][col]
-        newPuzzle.blankLocation = newrow, newcol
-
-        return newPuzzle
+        blank = self.blank
+        target = self.moveTargets[blank].get( move )
+        if target is None:
+            raise Exception( "Illegal move: %s" % move )
+
+        # The blank's bits are zero, so moving the tile is a subtraction
+        # from its old slot and an addition at the blank's slot.
+        bits = self.bits
+        tile = (self.board >> (bits * target)) & self.mask
+        board = self.board - (tile << (bits * target)) + (tile << (bits * blank))
+        keys = self.zobristKeys[tile]
+        return self.fromBoard( board, target, self.zobrist ^ keys[target] ^ keys[blank] )
 
     # Utilities for comparison and display
     def __eq__(self, other):
         """
-            Overloads '==' such that two eightPuzzles with the same configuration
+            Overloads '==' such that two puzzles with the same configuration
           are equal.
 
           >>> EightPuzzleState([0, 1, 2, 3, 4, 5, 6, 7, 8]) == \
               EightPuzzleState([1, 0, 2, 3, 4, 5, 6, 7, 8]).result('left')
           True
         """
-        for row in range( 3 ):
-            if self.cells[row] != other.cells[row]:
-                return False
-        return True
+        return (isinstance( other, SlidingPuzzleState ) and self.zobrist == other.zobrist
+                and self.board == other.board)
 
     def __hash__(self):
-        return hash(str(self.cells))
+        return self.zobrist
 
     def __getAsciiString(self):
         """
           Returns a display string for the maze
         """
+        digits = len(str(self.size - 1))
         lines = []
-        horizontalLine = ('-' * (13))
+        horizontalLine = ('-' * (1 + (digits + 3) * self.width))
         lines.append(horizontalLine)
         for row in self.cells:
             rowLine = '|'
             for col in row:
                 if col == 0:
                     col = ' '
-                rowLine = rowLine + ' ' + col.__str__() + ' |'
+                rowLine = rowLine + ' ' + col.__str__().rjust(digits) + ' |'
             lines.append(rowLine)
             lines.append(horizontalLine)
         return '\n'.join(lines)
@@ -185,23 +299,183 @@ class EightPuzzleState:
     def __str__(self):
         return self.__getAsciiString()
 
+class EightPuzzleState(SlidingPuzzleState):
+    """
+    The Eight Puzzle is described in the course textbook on
+    page 64.
+
+    This class defines the mechanics of the puzzle itself.  The
+    task of recasting this puzzle as a search problem is left to
+    the EightPuzzleSearchProblem class.  It is the 3x3
+    SlidingPuzzleState.
+    """
+    __slots__ = ()
+
+def _geometry( width ):
+    "The class attributes of the SlidingPuzzleState subclass for 'width'."
+    size = width * width
+    bits = tileBits( size )
+    moves = ranking.moveTable( width )
+    return {'width': width,
+            'size': size,
+            'bits': bits,
+            'mask': (1 << bits) - 1,
+            'legalMoveTable': tuple([tuple([move for move, _ in targets]) for targets in moves]),
+            'moveTargets': tuple([dict(targets) for targets in moves]),
+            'goalBoard': packNumbers( range( size ), bits ),
+            'zobristKeys': zobristKeys( size )}
+
+for _name, _value in _geometry( 3 ).items():
+    setattr( EightPuzzleState, _name, _value )
+
+_puzzleClasses = {3: EightPuzzleState}
+
+def puzzleClass( width ):
+    """
+      Returns the SlidingPuzzleState subclass for width x width boards,
+    EightPuzzleState for width 3, making it the first time it is asked for.
+    """
+    if width not in _puzzleClasses:
+        attributes = _geometry( width )
+        attributes['__slots__'] = ()
+        attributes['__module__'] = __name__
+        _puzzleClasses[width] = type( 'SlidingPuzzle%dState' % width, (SlidingPuzzleState,), attributes )
+    return _puzzleClasses[width]
+
+class SlidingPuzzleBoard:
+    """
+      A mutable sliding puzzle for depth-first solvers such as
+    search.idaStarSearch, which move the blank in place and undo each move
+    on the way back instead of allocating a new state for every node.
+    isGoal() compares with the packed 'goalBoard', by default the standard
+    goal of the state's class.
+    """
+    __slots__ = ('board', 'blank', 'zobrist', 'puzzle', 'goalBoard')
+
+    def __init__( self, state, goalBoard=None ):
+        self.board = state.board
+        self.blank = state.blank
+        self.zobrist = state.zobrist
+        self.puzzle = type( state )
+        self.goalBoard = self.puzzle.goalBoard if goalBoard is None else goalBoard
+
+    def tileAt( self, index ):
+        "Returns the tile at the given row-major index."
+        return (self.board >> (self.puzzle.bits * index)) & self.puzzle.mask
+
+    def isGoal( self ):
+        return self.board == self.goalBoard
+
+    def legalMoves( self ):
+        "Returns the legal moves of the blank, as a tuple."
+        return self.puzzle.legalMoveTable[self.blank]
+
+    def inverse( self, move ):
+        "Returns the move that undoes 'move'."
+        return INVERSE_MOVES[move]
+
+    def move( self, move ):
+        "Moves the blank in place.  The move must be legal."
+        puzzle = self.puzzle
+        blank = self.blank
+        target = puzzle.moveTargets[blank][move]
+        bits = puzzle.bits
+        tile = (self.board >> (bits * target)) & puzzle.mask
+        self.board += (tile << (bits * blank)) - (tile << (bits * target))
+        self.blank = target
+        keys = puzzle.zobristKeys[tile]
+        self.zobrist ^= keys[target] ^ keys[blank]
+
+    def undo( self, move ):
+        "Takes back a move made with move()."
+        self.move( INVERSE_MOVES[move] )
+
+    def state( self ):
+        "Returns the current configuration as a state of the board's class."
+        return self.puzzle.fromBoard( self.board, self.blank, self.zobrist )
+
+# The eight puzzle's mutable board is the general one
+EightPuzzleBoard = SlidingPuzzleBoard
+
 # TODO: Implement The methods in this class
 
 class EightPuzzleSearchProblem(search.SearchProblem):
     """
       Implementation of a SearchProblem for the  Eight Puzzle domain
 
-      Each state is represented by an instance of an eightPuzzle.
+      Each state is represented by an instance of an eightPuzzle, or of
+      any SlidingPuzzleState: the problem takes its width from the start.
+
+      The goal may be any configuration of the same width.  The tiles are
+      renamed so that it becomes canonicalGoal(width, blank index), so
+      every table built for a goal (GoalTables, pattern databases, the
+      distance database) is shared by all the goals with the blank in the
+      same place.  The states searched are the relabeled ones; actions are
+      unchanged, and relabel() and originalState() convert states.
+
+      With a fifteen puzzle goal whose blank is in an odd row, so that the
+      canonical goal has its last two tiles swapped:
+
+      >>> rng = random.Random(0)
+      >>> numbers = rng.sample(range(1, 16), 15)
+      >>> numbers.insert(5, 0)
+      >>> goal = puzzleClass(4)(numbers)
+      >>> start = goal
+      >>> for i in range(30):
+      ...     start = start.result(rng.choice(start.legalMoves()))
+      >>> problem = EightPuzzleSearchProblem(start, goal)
+      >>> problem.getGoalState().numbers() == canonicalGoal(4, 5)
+      True
+      >>> states = [puzzleClass(4)(rng.sample(range(16), 16)) for i in range(100)]
+      >>> all(problem.originalState(problem.relabel(s)) == s for s in states + [start, goal])
+      True
+
+      The actions found on the relabeled problem solve the caller's puzzle:
+
+      >>> actions = search.idaStarSearch(problem, search.ManhattanHeuristic(problem.getGoalState()))[0]
+      >>> state = start
+      >>> for action in actions:
+      ...     state = state.result(action)
+      >>> state == goal
+      True
     """
-    def __init__(self,puzzle):
+    def __init__(self,puzzle,goal=None):
         "Creates a new EightPuzzleSearchProblem which stores search information."
-        self.puzzle = puzzle
+        size = puzzle.size
+        if goal is None or goal.board == puzzle.goalBoard:
+            self.labels = None
+        else:
+            canonical = canonicalGoal(puzzle.width, goal.blank)
+            self.labels = [0] * size
+            for index, tile in enumerate(goal.numbers()):
+                self.labels[tile] = canonical[index]
+        self.puzzle = self.relabel(puzzle)
+        self.goal = type(puzzle)(list(range(size))) if goal is None else self.relabel(goal)
+
+    def relabel(self, state):
+        "Renames the tiles of a state given in the caller's labels for searching."
+        if self.labels is None:
+            return state
+        labels = self.labels
+        return type(state)([labels[tile] for tile in state.numbers()])
+
+    def originalState(self, state):
+        "The inverse of relabel: a searched state in the caller's labels."
+        if self.labels is None:
+            return state
+        original = [0] * len(self.labels)
+        for tile, label in enumerate(self.labels):
+            original[label] = tile
+        return type(state)([original[tile] for tile in state.numbers()])
 
     def getStartState(self):
         return self.puzzle
 
     def isGoalState(self,state):
-        return state.isGoal()
+        return state.board == self.goal.board
+
+    def getGoalState(self):
+        return self.goal
 
     def getSuccessors(self,state):
         """
@@ -214,6 +488,36 @@ class EightPuzzleSearchProblem(search.SearchProblem):
             succ.append((state.result(a), a, 1))
         return succ
 
+    def iterSuccessors(self, state, lastAction=None):
+        """
+          Yields the (successor, action, stepCost) triples of getSuccessors
+          one at a time, without the move that undoes lastAction: it only
+          returns to the state the search just came from.
+        """
+        undoMove = INVERSE_MOVES.get(lastAction)
+        for a in state.legalMoves():
+            if a != undoMove:
+                yield (state.result(a), a, 1)
+
+    def getDuplicatePruning(self):
+        """
+          The movepruning.DuplicateAutomaton for boards of this width, with
+          which idaStarSearch skips move sequences that have a shorter or
+          earlier equivalent.
+        """
+        return movepruning.getDuplicateAutomaton(self.puzzle.width)
+
+    def getPredecessors(self,state):
+        """
+          Returns list of (predecessor, action, stepCost) pairs.  Moves
+          are reversible, so the predecessors are the successors, reached
+          from there by the inverse move.
+        """
+        pred = []
+        for a in state.legalMoves():
+            pred.append((state.result(a), INVERSE_MOVES[a], 1))
+        return pred
+
     def getCostOfActions(self, actions):
         """
          actions: A list of actions to take
@@ -223,6 +527,23 @@ class EightPuzzleSearchProblem(search.SearchProblem):
         """
         return len(actions)
 
+    def getStartBoard(self):
+        "Returns a mutable copy of the start state for in-place solvers."
+        return SlidingPuzzleBoard(self.puzzle, self.goal.board)
+
+    def getStateRank(self, state):
+        "Returns the dense rank of a state, for rank-indexed visited sets and tables."
+        return state.rank()
+
+    def getStateSpaceSize(self):
+        "Returns the number of states reachable from the goal, the bound on getStateRank."
+        return ranking.numStates(self.puzzle.width)
+
+    def isSolvable(self):
+        "True if the goal can be reached from the start state."
+        width = self.puzzle.width
+        return ranking.puzzleParity(self.puzzle.numbers(), width) == ranking.puzzleParity(self.goal.numbers(), width)
+
 EIGHT_PUZZLE_DATA = [[1, 0, 2, 3, 4, 5, 6, 7, 8],
                      [1, 7, 8, 2, 3, 4, 5, 6, 0],
                      [4, 3, 2, 7, 0, 5, 1, 6, 8],
@@ -250,6 +571,17 @@ def loadEightPuzzle(puzzleNumber):
     """
     return EightPuzzleState(EIGHT_PUZZLE_DATA[puzzleNumber])
 
+def createRandomPuzzle(width, moves=100):
+    """
+      Creates a random width x width puzzle by applying 'moves' random
+    moves to a solved puzzle.
+    """
+    puzzle = puzzleClass(width)(list(range(width * width)))
+    for i in range(moves):
+        # Execute a random legal move
+        puzzle = puzzle.result(random.sample(puzzle.legalMoves(), 1)[0])
+    return puzzle
+
 def createRandomEightPuzzle(moves=100):
     """
       moves: number of random moves to apply
@@ -259,13 +591,27 @@ def createRandomEightPuzzle(moves=100):
       puzzle.
 
     """
-    puzzle = EightPuzzleState([0,1,2,3,4,5,6,7,8])
-    for i in range(moves):
-        # Execute a random legal move
-        puzzle = puzzle.result(random.sample(puzzle.legalMoves(), 1)[0])
-    return puzzle
+    return createRandomPuzzle(3, moves)
 
 #/*=====Start Change Task 2 and 3=====*/
+def adaptHeuristic(test):
+    """
+      Turns one of search.h1test to h4test, which take the goal explicitly,
+    into a heuristic(state, problem) for search.aStarSearch that takes the
+    goal from problem.getGoalState().
+    """
+    def heuristic(state, problem):
+        return test(state, problem.getGoalState())
+    return heuristic
+
+# The heuristics the A* experiments are run with, by name
+HEURISTICS = {
+    'h1': adaptHeuristic(search.h1test),
+    'h2': adaptHeuristic(search.h2test),
+    'h3': adaptHeuristic(search.h3test),
+    'h4': adaptHeuristic(search.h4test),
+}
+
 def heuristicTests(pzl, glstate):
 
     #prints out the hueristics
@@ -288,29 +634,32 @@ def heuristicTests(pzl, glstate):
 if __name__ == '__main__':
 
     goal_state = EightPuzzleState([0, 1, 2, 3, 4, 5, 6, 7, 8])
+    manhattan = search.ManhattanHeuristic(goal_state)
 
-    h1_values_Astar = []
-    h2_values_Astar = []
-    h3_values_Astar = []
-    h4_values_Astar = []
-    h3_values = []
+    puzzles = []
+    optimal_lengths = []
 
-    path_lengths_Astar = []
+    # A* results are kept per heuristic name
+    path_lengths_Astar = dict([(name, []) for name in HEURISTICS])
+    path_lengths_IDAstar = []
     path_lengths_bfs = []
     path_lengths_dfs = []
     path_lengths_ucs = []
 
-    AstarMaxFringes = []
+    AstarMaxFringes = dict([(name, []) for name in HEURISTICS])
+    IDAstarMaxFringes = []
     bfsMaxFringes = []
     dfsMaxFringes = []
     ucsMaxFringes = []
 
-    AstarMaxDepths = []
+    AstarMaxDepths = dict([(name, []) for name in HEURISTICS])
+    IDAstarMaxDepths = []
     bfsMaxDepths = []
     dfsMaxDepths = []
     ucsMaxDepths = []
 
-    AstarExploredNodes = []
+    AstarExploredNodes = dict([(name, []) for name in HEURISTICS])
+    IDAstarExploredNodes = []
     bfsExploredNodes = []
     dfsExploredNodes = []
     ucsExploredNodes = []
@@ -325,18 +674,22 @@ if __name__ == '__main__':
         puzzle = createRandomEightPuzzle(num_moves)
         problem = EightPuzzleSearchProblem(puzzle)
 
-        path_Astar = search.aStarSearch(problem)
-        path_lengths_Astar.append(len(path_Astar[0]))
-        AstarMaxFringes.append(path_Astar[1])
-        AstarMaxDepths.append(path_Astar[2])
-        AstarExploredNodes.append(path_Astar[3])
+        for name in sorted(HEURISTICS):
+            path_Astar = search.aStarSearch(problem, HEURISTICS[name])
+            path_lengths_Astar[name].append(len(path_Astar[0]))
+            AstarMaxFringes[name].append(path_Astar[1])
+            AstarMaxDepths[name].append(path_Astar[2])
+            AstarExploredNodes[name].append(path_Astar[3])
 
-        h1_values_Astar.append(search.h1test(puzzle, goal_state) - len(path_Astar))
-        h2_values_Astar.append(search.h2test(puzzle, goal_state) - len(path_Astar))
-        h3_values_Astar.append(search.h3test(puzzle, goal_state) - len(path_Astar))
-        h4_values_Astar.append(search.h4test(puzzle, goal_state) - len(path_Astar))
+        # every heuristic is admissible, so any of the paths is optimal
+        puzzles.append(puzzle)
+        optimal_lengths.append(len(path_Astar[0]))
 
-        h3_values.append(search.h3test(puzzle, goal_state))
+        path_IDAstar = search.idaStarSearch(problem, manhattan)
+        path_lengths_IDAstar.append(len(path_IDAstar[0]))
+        IDAstarMaxFringes.append(path_IDAstar[1])
+        IDAstarMaxDepths.append(path_IDAstar[2])
+        IDAstarExploredNodes.append(path_IDAstar[3])
 
         path_bfs = search.breadthFirstSearch(problem)
         path_lengths_bfs.append(len(path_bfs[0]))
@@ -362,6 +715,14 @@ if __name__ == '__main__':
 
         n += 1
 
+    # h1 to h4 of all the puzzles in one call (vectorised if numpy is installed)
+    values = batchheuristics.heuristicValues(puzzles, goal_state)
+    h1_values_Astar = [h - length for h, length in zip(values['h1'], optimal_lengths)]
+    h2_values_Astar = [h - length for h, length in zip(values['h2'], optimal_lengths)]
+    h3_values_Astar = [h - length for h, length in zip(values['h3'], optimal_lengths)]
+    h4_values_Astar = [h - length for h, length in zip(values['h4'], optimal_lengths)]
+    h3_values = values['h3']
+
     # Calculate the average absolute differences
     avg_diff_h1_Astar = statistics.mean(h1_values_Astar)
     avg_diff_h2_Astar = statistics.mean(h2_values_Astar)
@@ -369,22 +730,26 @@ if __name__ == '__main__':
     avg_diff_h4_Astar = statistics.mean(h4_values_Astar)
 
     avg_h3 = statistics.mean(h3_values)
-    avg_Astar = statistics.mean(path_lengths_Astar)
+    avg_Astar = dict([(name, statistics.mean(path_lengths_Astar[name])) for name in HEURISTICS])
+    avg_IDAstar = statistics.mean(path_lengths_IDAstar)
     avg_bfs = statistics.mean(path_lengths_bfs)
     avg_dfs = statistics.mean(path_lengths_dfs)
     avg_ucs = statistics.mean(path_lengths_ucs)
 
-    astarAvgMaxFringe = statistics.mean(AstarMaxFringes)
+    astarAvgMaxFringe = dict([(name, statistics.mean(AstarMaxFringes[name])) for name in HEURISTICS])
+    idastarAvgMaxFringe = statistics.mean(IDAstarMaxFringes)
     bfsAvgMaxFringe = statistics.mean(bfsMaxFringes)
     dfsAvgMaxFringe = statistics.mean(dfsMaxFringes)
     ucsAvgMaxFringe = statistics.mean(ucsMaxFringes)
 
-    astarAvgMaxDepth = statistics.mean(AstarMaxDepths)
+    astarAvgMaxDepth = dict([(name, statistics.mean(AstarMaxDepths[name])) for name in HEURISTICS])
+    idastarAvgMaxDepth = statistics.mean(IDAstarMaxDepths)
     bfsAvgMaxDepth = statistics.mean(bfsMaxDepths)
     dfsAvgMaxDepth = statistics.mean(dfsMaxDepths)
     ucsAvgMaxDepth = statistics.mean(ucsMaxDepths)
 
-    astarAvgExploredNodes = statistics.mean(AstarExploredNodes)
+    astarAvgExploredNodes = dict([(name, statistics.mean(AstarExploredNodes[name])) for name in HEURISTICS])
+    idastarAvgExploredNodes = statistics.mean(IDAstarExploredNodes)
     bfsAvgExploredNodes= statistics.mean(bfsExploredNodes)
     dfsAvgExploredNodes = statistics.mean(dfsExploredNodes)
     ucsAvgExploredNodes = statistics.mean(ucsExploredNodes)
@@ -403,7 +768,9 @@ if __name__ == '__main__':
     print("Average maximum size of the fringe for each search algorithm using " + str(num) + " puzzles with " + str(
         num_moves) + " random moves")
     print("------------------------------------------------------------")
-    print("A Star: " + str(astarAvgMaxFringe))
+    for name in sorted(HEURISTICS):
+        print("A Star (" + name + "): " + str(astarAvgMaxFringe[name]))
+    print("IDA Star (h3): " + str(idastarAvgMaxFringe))
     print("Breadth First Search: " + str(bfsAvgMaxFringe))
     print("Depth First Search: " + str(dfsAvgMaxFringe))
     print("Uniform Cost Search: " + str(ucsAvgMaxFringe))
@@ -412,16 +779,21 @@ if __name__ == '__main__':
     print("Average maximum depth for each search algorithm using " + str(num) + " puzzles with " + str(
         num_moves) + " random moves")
     print("------------------------------------------------------------")
-    print("A Star: " + str(astarAvgMaxDepth))
+    for name in sorted(HEURISTICS):
+        print("A Star (" + name + "): " + str(astarAvgMaxDepth[name]))
+    print("IDA Star (h3): " + str(idastarAvgMaxDepth))
     print("Breadth First Search: " + str(bfsAvgMaxDepth))
     print("Depth First Search: " + str(dfsAvgMaxDepth))
     print("Uniform Cost Search: " + str(ucsAvgMaxDepth))
     print()
 
-    print("Average number of expanded nodes for each search algorithm using " + str(num) + " puzzles with " + str(
+    print("Average number of explored nodes for each search algorithm using " + str(num) + " puzzles with " + str(
         num_moves) + " random moves")
+    print("(A Star counts popped plus generated nodes, the others expanded nodes)")
     print("------------------------------------------------------------")
-    print("A Star: " + str(astarAvgExploredNodes))
+    for name in sorted(HEURISTICS):
+        print("A Star (" + name + "): " + str(astarAvgExploredNodes[name]))
+    print("IDA Star (h3): " + str(idastarAvgExploredNodes))
     print("Breadth First Search: " + str(bfsAvgExploredNodes))
     print("Depth First Search: " + str(dfsAvgExploredNodes))
     print("Uniform Cost Search: " + str(ucsAvgExploredNodes))
@@ -431,7 +803,9 @@ if __name__ == '__main__':
         num_moves) + " random moves")
     print("------------------------------------------------------------")
     print("h3: " + str(avg_h3))
-    print("A Star: " + str(avg_Astar))
+    for name in sorted(HEURISTICS):
+        print("A Star (" + name + "): " + str(avg_Astar[name]))
+    print("IDA Star (h3): " + str(avg_IDAstar))
     print("Breadth First Search: " + str(avg_bfs))
     print("Depth First Search: " + str(avg_dfs))
     print("Uniform Cost Search: " + str(avg_ucs))
@@ -446,8 +820,15 @@ if __name__ == '__main__':
         for i in generate_puzzles:
             print(i)
             prob = EightPuzzleSearchProblem(i)
-            pat = search.aStarSearch(prob)
-            print("A* found a path of " + str(len(pat)) + " moves.")
+            try:
+                pat = search.aStarSearch(prob, HEURISTICS['h3'])
+            except search.UnsolvablePuzzle:
+                print("The puzzle is unsolvable.")
+                continue
+            if pat[0] is None:
+                print("A* found no path.")
+                continue
+            print("A* found a path of " + str(len(pat[0])) + " moves.")
             print(pat)
     print()
 
@@ -457,7 +838,7 @@ if __name__ == '__main__':
     print()
 
     problem = EightPuzzleSearchProblem(puzzle)
-    path= search.aStarSearch(problem)    
+    path= search.aStarSearch(problem, HEURISTICS['h3'])
 
     path2 = search.breadthFirstSearch(problem)
 
@@ -0,0 +1,215 @@
+# heuristictables.py
+# ------------------
+# Heuristics backed by tables that are built once and cached on disk under
+# tables/, for boards of any width (in practice 3x3 and 4x4):
+#
+#   LinearConflictTableHeuristic  search.LinearConflictHeuristic with the
+#                                 conflicts of every possible row and column
+#                                 looked up rather than counted
+#   WalkingDistanceHeuristic      Takahashi's walking distance: the moves
+#                                 needed to bring every tile to its goal row,
+#                                 and separately to its goal column, when
+#                                 tiles only count by which row (column)
+#                                 they belong in
+
+import os
+import util
+import pickle
+import search
+
+TABLE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables')
+
+def _cached(filename, build):
+    """
+      Returns the object pickled in TABLE_DIRECTORY/filename, first building
+    it with build() and saving it if the file is missing.
+    """
+    path = os.path.join(TABLE_DIRECTORY, filename)
+    if os.path.exists(path):
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+    table = build()
+    util.writeAtomically(path, pickle.dumps(table, pickle.HIGHEST_PROTOCOL))
+    return table
+
+def _goalName(tables):
+    "A file name fragment identifying the goal of some search.GoalTables."
+    return '%d-%s' % (tables.width, ''.join(['%x' % index for index in tables.goalIndex]))
+
+class LinearConflictTableHeuristic:
+    """
+      Manhattan distance plus two moves per tile that must leave its goal row
+    or column (see search.lineConflicts), with the conflicts of each row and
+    column read from a table indexed by the line's packed tiles.  A row is a
+    single shift and mask of the packed board.  The table, one byte per
+    possible content of each line, is cached per goal.
+
+      It gives the values of search.LinearConflictHeuristic, and childValue
+    agrees with the full evaluation:
+
+    >>> import random, eightpuzzle
+    >>> rng = random.Random(0)
+    >>> for width in (3, 4):
+    ...     puzzle = eightpuzzle.puzzleClass(width)
+    ...     goal = puzzle(list(range(width * width)))
+    ...     heuristic = LinearConflictTableHeuristic(goal)
+    ...     counted = search.LinearConflictHeuristic(goal)
+    ...     states = [puzzle(rng.sample(range(width * width), width * width)) for i in range(200)]
+    ...     assert all(heuristic(s) == counted(s) for s in states)
+    ...     assert all(heuristic.childValue(heuristic(s), s, move) == heuristic(s.result(move))
+    ...                for s in states for move in s.legalMoves())
+    """
+    def __init__(self, goal):
+        self.tables = search.goalTables(goal)
+        self.width = self.tables.width
+        self.bits = self.tables.bits
+        self.lineSize = 1 << (self.bits * self.width)
+        self.conflicts = _cached('linearconflict-%s.pickle' % _goalName(self.tables), self.buildConflicts)
+
+    def buildConflicts(self):
+        """
+          Returns a bytearray with the conflicts of row r for packed content c
+        at r * lineSize + c, followed by those of the columns.
+        """
+        width, bits = self.width, self.bits
+        mask = (1 << bits) - 1
+        goalRow = [index // width for index in self.tables.goalIndex]
+        goalCol = [index % width for index in self.tables.goalIndex]
+        table = bytearray(2 * width * self.lineSize)
+        for content in range(self.lineSize):
+            tiles = [(content >> (bits * i)) & mask for i in range(width)]
+            if max(tiles) >= self.tables.size:
+                continue
+            for line in range(width):
+                table[line * self.lineSize + content] = search.lineConflicts(
+                    [goalCol[tile] for tile in tiles if tile != 0 and goalRow[tile] == line])
+                table[(width + line) * self.lineSize + content] = search.lineConflicts(
+                    [goalRow[tile] for tile in tiles if tile != 0 and goalCol[tile] == line])
+        return table
+
+    def rowContent(self, board, row):
+        return (board >> (self.bits * self.width * row)) & (self.lineSize - 1)
+
+    def colContent(self, board, col):
+        width, bits = self.width, self.bits
+        mask = (1 << bits) - 1
+        content = 0
+        for row in range(width):
+            content |= ((board >> (bits * (row * width + col))) & mask) << (bits * row)
+        return content
+
+    def lineConflicts(self, board):
+        "Total conflicts over all rows and columns of a packed board."
+        conflicts, lineSize, width = self.conflicts, self.lineSize, self.width
+        total = 0
+        for line in range(width):
+            total += conflicts[line * lineSize + self.rowContent(board, line)]
+            total += conflicts[(width + line) * lineSize + self.colContent(board, line)]
+        return total
+
+    def __call__(self, state, problem=None):
+        return self.tables.total(self.tables.manhattan, state) + 2 * self.lineConflicts(state.board)
+
+    def childValue(self, value, state, move):
+        """
+          Returns the value after the blank of 'state' makes 'move', given the
+        value before: the moved tile's change in Manhattan distance, and the
+        change in conflicts of the two rows (vertical moves) or columns
+        (horizontal moves) it leaves and enters.
+        """
+        width, bits, lineSize = self.width, self.bits, self.lineSize
+        blank = state.blank
+        target = blank + self.tables.offsets[move]
+        board = state.board
+        tile = (board >> (bits * target)) & ((1 << bits) - 1)
+        child = board + (tile << (bits * blank)) - (tile << (bits * target))
+        distances = self.tables.manhattan[tile]
+        value += distances[blank] - distances[target]
+
+        conflicts = self.conflicts
+        if move == 'up' or move == 'down':
+            for row in (blank // width, target // width):
+                value += 2 * (conflicts[row * lineSize + self.rowContent(child, row)]
+                              - conflicts[row * lineSize + self.rowContent(board, row)])
+        else:
+            for col in (blank % width, target % width):
+                offset = (width + col) * lineSize
+                value += 2 * (conflicts[offset + self.colContent(child, col)]
+                              - conflicts[offset + self.colContent(board, col)])
+        return value
+
+def buildWalkingDistances(width, goalBlankLine):
+    """
+      Breadth-first search over the row abstraction of a width x width board:
+    for each row, how many of its tiles belong in each goal row, plus the row
+    of the blank.  A move takes any tile from a row next to the blank's into
+    the blank's row.  Returns a dict from (blankRow,) + the flattened counts
+    to the fewest moves back to the goal, where every row holds its own
+    tiles and the blank is in goalBlankLine.  By symmetry the same table
+    serves columns.
+    """
+    goal = [0] * (width * width)
+    for line in range(width):
+        goal[line * width + line] = width - 1 if line == goalBlankLine else width
+    start = (goalBlankLine,) + tuple(goal)
+    distances = {start: 0}
+    layer = [start]
+    depth = 0
+    while layer:
+        depth += 1
+        nextLayer = []
+        for key in layer:
+            blankRow, counts = key[0], key[1:]
+            for row in (blankRow - 1, blankRow + 1):
+                if row < 0 or row >= width:
+                    continue
+                for goalRow in range(width):
+                    if counts[row * width + goalRow] == 0:
+                        continue
+                    moved = list(counts)
+                    moved[row * width + goalRow] -= 1
+                    moved[blankRow * width + goalRow] += 1
+                    succ = (row,) + tuple(moved)
+                    if succ not in distances:
+                        distances[succ] = depth
+                        nextLayer.append(succ)
+        layer = nextLayer
+    return distances
+
+class WalkingDistanceHeuristic:
+    """
+      The walking distance to 'goal': the moves needed to bring every tile to
+    its goal row when tiles are told apart only by goal row, plus the same
+    for columns.  Both parts are lower bounds on the vertical and horizontal
+    moves respectively, so the sum is admissible, and it is usually well
+    above the Manhattan distance.  The distance tables (see
+    buildWalkingDistances) are cached per width and goal blank line.
+    """
+    def __init__(self, goal):
+        self.tables = search.goalTables(goal)
+        width = self.width = self.tables.width
+        goalBlankRow, goalBlankCol = divmod(self.tables.goalIndex[0], width)
+        self.rowDistances = _cached('walkingdistance-%d-%d.pickle' % (width, goalBlankRow),
+                                    lambda: buildWalkingDistances(width, goalBlankRow))
+        self.colDistances = _cached('walkingdistance-%d-%d.pickle' % (width, goalBlankCol),
+                                    lambda: buildWalkingDistances(width, goalBlankCol))
+        self.goalRow = [index // width for index in self.tables.goalIndex]
+        self.goalCol = [index % width for index in self.tables.goalIndex]
+
+    def __call__(self, state, problem=None):
+        width, bits = self.width, self.tables.bits
+        mask = (1 << bits) - 1
+        goalRow, goalCol = self.goalRow, self.goalCol
+        rowCounts = [0] * (width * width)
+        colCounts = [0] * (width * width)
+        board = state.board
+        for index in range(width * width):
+            tile = board & mask
+            board >>= bits
+            if tile != 0:
+                row, col = divmod(index, width)
+                rowCounts[row * width + goalRow[tile]] += 1
+                colCounts[col * width + goalCol[tile]] += 1
+        blankRow, blankCol = divmod(state.blank, width)
+        return (self.rowDistances[(blankRow,) + tuple(rowCounts)]
+                + self.colDistances[(blankCol,) + tuple(colCounts)])
@@ -0,0 +1,257 @@
+# movepruning.py
+# --------------
+# Duplicate-path pruning for the depth-first sliding puzzle searches.
+#
+# Skipping the move that undoes the previous one removes only the paths
+# that come straight back.  Many more reach the same board as a shorter
+# path, or as one of the same length whose moves come first in the order
+# of MOVES: moves on opposite sides of a 2x2 block commute, for instance.
+# learnDuplicates finds such move sequences offline, by a breadth-first
+# search over the move sequences from every place of the blank, and
+# DuplicateAutomaton recognises all of them at once, one list lookup per
+# move.  The first shortest path to any board contains none of them, so a
+# tree search that never completes one still reaches every board at its
+# optimal depth.
+#
+# The patterns of the eight and fifteen puzzles are stored next to this
+# module, in pruning3.txt and pruning4.txt.  Running
+#
+#   python movepruning.py <width> <depth>
+#
+# learns the patterns of up to 'depth' moves and rewrites that file.
+
+import os
+import sys
+import time
+import collections
+import ranking
+
+MOVES = ('up', 'down', 'left', 'right')
+MOVE_INDEX = dict([(move, index) for index, move in enumerate(MOVES)])
+LETTERS = dict([(move[0], move) for move in MOVES])
+
+PATTERN_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+#pattern length learned on the fly for widths without a stored file
+DEFAULT_DEPTH = 8
+
+def learnDuplicates(width, depth):
+    """
+      Returns the duplicate move sequences of at most 'depth' moves on
+    width x width boards, as (blank, moves) pairs: from the blank index
+    'blank', the tuple 'moves' leads to the same board as a shorter
+    sequence, or as one of the same length that comes first in the order
+    of MOVES.  Sequences that end in or extend a shorter duplicate are left
+    out, since the search never gets past that one.
+
+      Each breadth-first layer is grown for every place of the blank before
+    the next, so all the shorter patterns are known when a sequence is.
+    """
+    size = width * width
+    table = ranking.moveTable(width)
+    known = set()
+    patterns = []
+    seen = []
+    layers = []
+    for start in range(size):
+        cells = list(range(1, size))
+        cells.insert(start, 0)
+        seen.append(set([tuple(cells)]))
+        layers.append([(tuple(cells), start, ())])
+
+    for length in range(depth):
+        for start in range(size):
+            nextLayer = []
+            for cells, blank, sequence in layers[start]:
+                for move, target in table[blank]:
+                    extended = sequence + ((blank, move),)
+                    if any(extended[i:] in known for i in range(1, len(extended))):
+                        continue
+                    moved = list(cells)
+                    moved[blank], moved[target] = moved[target], 0
+                    moved = tuple(moved)
+                    if moved in seen[start]:
+                        known.add(extended)
+                        patterns.append((start, tuple([step for _, step in extended])))
+                    else:
+                        seen[start].add(moved)
+                        nextLayer.append((moved, target, extended))
+            layers[start] = nextLayer
+    return patterns
+
+def patternPath(width, directory=PATTERN_DIRECTORY):
+    "The file of the stored patterns for width x width boards."
+    return os.path.join(directory, 'pruning%d.txt' % width)
+
+def savePatterns(path, patterns, depth):
+    """
+      Writes one pattern per line: the blank index, then the moves by their
+    first letters.
+    """
+    with open(path, 'w') as f:
+        f.write('# duplicate move sequences of up to %d moves: blank index, moves\n' % depth)
+        for blank, moves in patterns:
+            f.write('%d %s\n' % (blank, ''.join([move[0] for move in moves])))
+
+def loadPatterns(path):
+    "Reads the patterns written by savePatterns."
+    patterns = []
+    with open(path) as f:
+        for line in f:
+            if line.startswith('#'):
+                continue
+            blank, letters = line.split()
+            patterns.append((int(blank), tuple([LETTERS[letter] for letter in letters])))
+    return patterns
+
+class DuplicateAutomaton:
+    """
+      An Aho-Corasick automaton over the moves of a search path, which
+    recognises each duplicate pattern as its last move is made.
+
+      There is one start state per place of the blank, and every state
+    knows where the blank is, so a sequence that is a duplicate from some
+    places only is told apart.  The transitions are a flat list, four
+    entries per state in the order of MOVES, holding the next state, or
+    None where the move completes a pattern (or is not legal).
+
+    >>> import types
+    >>> patterns = learnDuplicates(3, 8)
+    >>> automaton = DuplicateAutomaton(3, patterns)
+    >>> def walk(blank, moves):
+    ...     state = automaton.start(types.SimpleNamespace(blank=blank))
+    ...     for move in moves:
+    ...         if state is None:
+    ...             break
+    ...         state = automaton.step(state, move)
+    ...     return state
+
+    Going around a 2x2 block three moves one way and three the other is
+    the same as the other way round, which comes first in MOVES order:
+
+    >>> walk(0, ['right', 'down', 'left', 'up', 'right', 'down']) is None
+    True
+    >>> walk(0, ['down', 'right', 'up', 'left', 'down', 'right']) is None
+    False
+
+    Every pattern is recognised at its last move and not before:
+
+    >>> all(walk(blank, moves[:-1]) is not None and walk(blank, moves) is None
+    ...     for blank, moves in patterns)
+    True
+
+    and the first shortest path to each board, found breadth first in
+    MOVES order, is never pruned:
+
+    >>> table = ranking.moveTable(3)
+    >>> start = (1, 2, 3, 4, 0, 5, 6, 7, 8)
+    >>> seen = {start: automaton.start(types.SimpleNamespace(blank=4))}
+    >>> layer = [start]
+    >>> while layer:
+    ...     nextLayer = []
+    ...     for cells in layer:
+    ...         blank = cells.index(0)
+    ...         for move, target in table[blank]:
+    ...             moved = list(cells)
+    ...             moved[blank], moved[target] = moved[target], 0
+    ...             moved = tuple(moved)
+    ...             if moved not in seen:
+    ...                 seen[moved] = automaton.step(seen[cells], move)
+    ...                 assert seen[moved] is not None
+    ...                 nextLayer.append(moved)
+    ...     layer = nextLayer
+    >>> len(seen)
+    181440
+    """
+    def __init__(self, width, patterns):
+        size = width * width
+        table = ranking.moveTable(width)
+        targets = [dict(moves) for moves in table]
+
+        #a trie of the patterns, whose nodes 0..size-1 are the start states
+        children = [[None] * 4 for index in range(size)]
+        blanks = list(range(size))
+        terminal = [False] * size
+        for start, moves in patterns:
+            node = start
+            for move in moves:
+                index = MOVE_INDEX[move]
+                if children[node][index] is None:
+                    children[node][index] = len(children)
+                    children.append([None] * 4)
+                    blanks.append(targets[blanks[node]][move])
+                    terminal.append(False)
+                node = children[node][index]
+            terminal[node] = True
+
+        #breadth-first over the trie: a missing child falls back to the
+        #transition of the node's failure state, the longest proper suffix
+        #of its moves in the trie, which ends with the blank in the same place
+        transitions = [None] * (4 * len(children))
+        fail = [0] * len(children)
+        queue = collections.deque()
+        for root in range(size):
+            for move, target in table[root]:
+                index = MOVE_INDEX[move]
+                child = children[root][index]
+                if child is None:
+                    transitions[4 * root + index] = target
+                else:
+                    transitions[4 * root + index] = child
+                    fail[child] = target
+                    terminal[child] = terminal[child] or terminal[target]
+                    queue.append(child)
+        while queue:
+            node = queue.popleft()
+            if terminal[node]:
+                continue
+            for move, target in table[blanks[node]]:
+                index = MOVE_INDEX[move]
+                child = children[node][index]
+                fallback = transitions[4 * fail[node] + index]
+                if child is None:
+                    transitions[4 * node + index] = fallback
+                else:
+                    transitions[4 * node + index] = child
+                    fail[child] = fallback
+                    terminal[child] = terminal[child] or terminal[fallback]
+                    queue.append(child)
+
+        self.transitions = [None if state is None or terminal[state] else state for state in transitions]
+        self.numStates = len(children)
+        self.numPatterns = len(patterns)
+
+    def start(self, board):
+        "The state before any move, for a board or state with its blank at board.blank."
+        return board.blank
+
+    def step(self, state, move):
+        "The state after 'move', or None if the move completes a duplicate."
+        return self.transitions[4 * state + MOVE_INDEX[move]]
+
+_automata = {}
+
+def getDuplicateAutomaton(width):
+    """
+      The DuplicateAutomaton for width x width boards, from the stored
+    patterns if there are any and otherwise from patterns of up to
+    DEFAULT_DEPTH moves learned now.  It is made once per width.
+    """
+    if width not in _automata:
+        path = patternPath(width)
+        if os.path.exists(path):
+            patterns = loadPatterns(path)
+        else:
+            patterns = learnDuplicates(width, DEFAULT_DEPTH)
+        _automata[width] = DuplicateAutomaton(width, patterns)
+    return _automata[width]
+
+if __name__ == '__main__':
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_DEPTH
+    start = time.time()
+    patterns = learnDuplicates(width, depth)
+    print("%d patterns of up to %d moves learned in %.1f s" % (len(patterns), depth, time.time() - start))
+    savePatterns(patternPath(width), patterns, depth)
+    automaton = DuplicateAutomaton(width, patterns)
+    print("%d automaton states" % automaton.numStates)
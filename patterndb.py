@@ -0,0 +1,342 @@
+# patterndb.py
+# ------------
+# Disjoint additive pattern databases for sliding puzzles of any width.
+#
+# A pattern is a set of tiles.  Its database holds, for every placement of
+# those tiles, the fewest moves *of pattern tiles* needed to bring them to
+# their goal places, wherever the other tiles are.  It is built by a 0-1
+# breadth-first search over abstract states (the pattern tiles' places plus
+# the blank), in which moving any other tile costs nothing.  Since each move
+# moves a single tile, the values of disjoint patterns add up to an
+# admissible heuristic: AdditivePatternHeuristic.
+#
+# Tables are byte arrays indexed by ranking.rankPartialPermutation of the
+# pattern tiles' places, saved under tables/ and memory-mapped when loaded.
+# They can also be stored four bits per entry and min-compressed (see
+# STORAGE and minCompress), trading heuristic strength for memory.
+# Running
+#
+#   python patterndb.py <width> <partition>
+#
+# builds (or loads) the databases of one of the PARTITIONS and reports their
+# build time, size and lookup cost.
+
+import os
+import sys
+import mmap
+import time
+import random
+import util
+import search
+import ranking
+import eightpuzzle
+
+UNREACHABLE = 255
+
+TABLE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables')
+
+# Partitions of the tiles for the goal with the blank in the top-left corner.
+# A five-tile pattern of the fifteen puzzle builds in under a minute and a
+# six-tile one in about eight minutes and 400 MB; the 7-8 partition's
+# eight-tile pattern, eight billion abstract states, is out of reach of
+# buildPatternTable.
+PARTITIONS = {
+    3: {'4-4': [(1, 2, 3, 4), (5, 6, 7, 8)],
+        '2-3-3': [(1, 2), (3, 4, 5), (6, 7, 8)]},
+    4: {'6-6-3': [(1, 4, 5, 8, 9, 12), (2, 3, 6, 7, 10, 11), (13, 14, 15)],
+        '5-5-5': [(1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15)],
+        '3-3-3-3-3': [(1, 2, 3), (4, 5, 6), (7, 8, 9), (10, 11, 12), (13, 14, 15)]},
+}
+
+def buildPatternTable(width, pattern, goalIndex):
+    """
+      Returns a bytearray holding, at the rank of each placement of the
+    tiles in 'pattern', the fewest moves of those tiles that bring them to
+    their places goalIndex[tile], with the blank starting anywhere.
+
+      The 0-1 breadth-first search visits abstract states, numbered
+    rank * size + blank, one cost at a time, so the first time a placement
+    is visited, with any blank, is its value.  Moves of the blank around the
+    other tiles cost nothing and are followed at once; moves of pattern tiles
+    queue each state of the next cost once, and it is skipped if the current
+    cost reaches it after all.
+
+    >>> table = buildPatternTable(3, (1, 2), list(range(9)))
+    >>> len(table), table[ranking.rankPartialPermutation([1, 2], 9)], max(table)
+    (72, 0, 7)
+    """
+    size = width * width
+    count = len(pattern)
+    entries = ranking.numPartialPermutations(count, size)
+    neighbours = [[cell for move, cell in moves] for moves in ranking.moveTable(width)]
+    table = bytearray([UNREACHABLE]) * entries
+    visited = util.Bitset(entries * size)
+    queued = util.Bitset(entries * size)
+    start = ranking.rankPartialPermutation([goalIndex[tile] for tile in pattern], size)
+    level = [start * size + goalIndex[0]]
+    cost = 0
+    while level:
+        nextLevel = []
+        for key in level:
+            if key in visited:
+                continue
+            visited.add(key)
+            rank, blank = divmod(key, size)
+            if table[rank] == UNREACHABLE:
+                table[rank] = cost
+            places = ranking.unrankPartialPermutation(rank, count, size)
+            #every cell the blank reaches without moving a pattern tile
+            cells = [blank]
+            while cells:
+                blank = cells.pop()
+                for cell in neighbours[blank]:
+                    if cell in places:
+                        moved = list(places)
+                        moved[places.index(cell)] = blank
+                        movedKey = ranking.rankPartialPermutation(moved, size) * size + cell
+                        if movedKey not in visited and movedKey not in queued:
+                            queued.add(movedKey)
+                            nextLevel.append(movedKey)
+                    else:
+                        freeKey = rank * size + cell
+                        if freeKey not in visited:
+                            visited.add(freeKey)
+                            cells.append(cell)
+        level = nextLevel
+        cost += 1
+    return table
+
+class PatternDatabase:
+    """
+      The table of buildPatternTable for one pattern, one byte per entry.
+    value(places) looks up the placement with the pattern's tiles at the
+    given board indices.  With a compression factor above 1 the table is
+    min-compressed (see minCompress): each entry serves 'factor'
+    consecutive ranks.  The place of the last tile is the lowest digit of
+    the rank, with size - len(pattern) + 1 values, so those ranks differ
+    only in that place when 'factor' divides this number; otherwise a run
+    also spans placements of the other tiles.  Either way it is a minimum.
+    """
+    def __init__(self, pattern, size, table, buildTime=None, factor=1):
+        self.pattern = tuple(pattern)
+        self.size = size
+        self.table = table
+        self.buildTime = buildTime
+        self.factor = factor
+
+    def value(self, places):
+        return self.table[ranking.rankPartialPermutation(places, self.size) // self.factor]
+
+    def save(self, path):
+        util.writeAtomically(path, self.table)
+
+class NibblePatternDatabase(PatternDatabase):
+    "A PatternDatabase packed by packNibbles, two entries per byte."
+    def value(self, places):
+        index = ranking.rankPartialPermutation(places, self.size) // self.factor
+        return (self.table[index >> 1] >> ((index & 1) << 2)) & 15
+
+STORAGE = {
+    'byte': PatternDatabase,
+    'nibble': NibblePatternDatabase,
+}
+
+def minCompress(table, factor):
+    """
+      Returns 'table' with each run of 'factor' consecutive entries replaced by
+    their minimum, which is still a lower bound for every one of them.
+    """
+    return bytearray([min(table[i:i + factor]) for i in range(0, len(table), factor)])
+
+def packNibbles(table):
+    """
+      Packs 'table' into four bits per entry, entry i in the low half of byte
+    i // 2 when i is even and the high half when it is odd.  Values above 15
+    are stored as 15, which keeps them admissible.
+    """
+    packed = bytearray((len(table) + 1) // 2)
+    for i in range(len(table)):
+        packed[i >> 1] |= min(table[i], 15) << ((i & 1) << 2)
+    return packed
+
+def patternPath(tables, pattern, directory=TABLE_DIRECTORY, storage='byte', factor=1):
+    "The file of the database for 'pattern' and the goal of some search.GoalTables."
+    goal = ''.join(['%x' % index for index in tables.goalIndex])
+    tiles = '.'.join(['%d' % tile for tile in pattern])
+    name = 'pdb-%d-%s-%s' % (tables.width, goal, tiles)
+    if storage != 'byte' or factor != 1:
+        name += '-%s-%d' % (storage, factor)
+    return os.path.join(directory, name + '.pdb')
+
+def tableLength(count, size, storage='byte', factor=1):
+    "The number of bytes of the stored table of a pattern of 'count' tiles."
+    entries = ranking.numPartialPermutations(count, size)
+    entries = (entries + factor - 1) // factor
+    if storage == 'nibble':
+        entries = (entries + 1) // 2
+    return entries
+
+def loadPatternDatabase(path, pattern, size, storage='byte', factor=1):
+    "Memory-maps a table written by PatternDatabase.save, checking its length."
+    with open(path, 'rb') as file:
+        table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    expected = tableLength(len(pattern), size, storage, factor)
+    if len(table) != expected:
+        raise Exception("%s has %d bytes rather than %d; delete it to rebuild it"
+                        % (path, len(table), expected))
+    return STORAGE[storage](pattern, size, table, factor=factor)
+
+def getPatternDatabase(goal, pattern, directory=TABLE_DIRECTORY, storage='byte', factor=1):
+    """
+      Loads the database for 'pattern' and 'goal' from 'directory', building
+    and saving it first if it is missing.  A database built here records its
+    build time.  'storage' is a key of STORAGE and 'factor' the
+    min-compression factor; compressed tables are made from the full one.
+    """
+    tables = search.goalTables(goal)
+    path = patternPath(tables, pattern, directory, storage, factor)
+    if os.path.exists(path):
+        return loadPatternDatabase(path, pattern, tables.size, storage, factor)
+    if storage == 'byte' and factor == 1:
+        start = time.time()
+        table = buildPatternTable(tables.width, pattern, tables.goalIndex)
+        buildTime = time.time() - start
+    else:
+        full = getPatternDatabase(goal, pattern, directory)
+        table, buildTime = bytearray(full.table), full.buildTime
+        if factor > 1:
+            table = minCompress(table, factor)
+        if storage == 'nibble':
+            table = packNibbles(table)
+    database = STORAGE[storage](pattern, tables.size, table, buildTime, factor)
+    database.save(path)
+    return database
+
+class AdditivePatternHeuristic:
+    """
+      The sum of the pattern databases of a partition of the tiles (a list of
+    disjoint tuples of tiles, which need not cover every tile) for 'goal'.
+    Usable by search.aStarSearch and search.idaStarSearch, including the
+    incremental childValue, which looks up only the moved tile's pattern.
+    'storage' and 'factor' select the table format (see getPatternDatabase).
+
+      With reflect=True the value is the larger of the sums for the state and
+    for its reflection in the main diagonal, with tiles renamed so that the
+    goal reflects onto itself.  Both are exact distances apart from the
+    abstraction, so the max is admissible, and the reflection looks at the
+    state from another pattern's point of view for free.  This needs the
+    goal's blank on the diagonal.
+
+      On the eight puzzle both stay within the exact distances, the
+    reflection never lowers the value, and childValue agrees with a full
+    evaluation after every legal move:
+
+    >>> import tempfile, distancedb
+    >>> goal = eightpuzzle.EightPuzzleState(list(range(9)))
+    >>> directory = tempfile.mkdtemp()
+    >>> exact = distancedb.getDistanceDatabase()
+    >>> rng = random.Random(0)
+    >>> states = [eightpuzzle.EightPuzzleState.unrank(rank) for rank in rng.sample(range(181440), 1000)]
+    >>> for name in ('2-3-3', '4-4'):
+    ...     plain = AdditivePatternHeuristic(goal, PARTITIONS[3][name], directory)
+    ...     reflected = AdditivePatternHeuristic(goal, PARTITIONS[3][name], directory, reflect=True)
+    ...     assert plain(goal) == reflected(goal) == 0
+    ...     assert all(plain(s) <= reflected(s) <= exact(s) for s in states)
+    ...     assert any(plain(s) < reflected(s) for s in states)
+    ...     for h in (plain, reflected):
+    ...         assert all(h.childValue(h(s), s, move) == h(s.result(move))
+    ...                    for s in states for move in s.legalMoves())
+    """
+    def __init__(self, goal, partition, directory=TABLE_DIRECTORY, storage='byte', factor=1, reflect=False):
+        self.tables = search.goalTables(goal)
+        tiles = [tile for pattern in partition for tile in pattern]
+        if len(set(tiles)) != len(tiles) or 0 in tiles:
+            raise Exception("Patterns must be disjoint sets of tiles: %s" % (partition,))
+        self.databases = [getPatternDatabase(goal, pattern, directory, storage, factor) for pattern in partition]
+        self.tileDatabase = {}
+        for database in self.databases:
+            for tile in database.pattern:
+                self.tileDatabase[tile] = database
+
+        self.reflect = reflect
+        if reflect:
+            width, goalIndex = self.tables.width, self.tables.goalIndex
+            self.transpose = [(index % width) * width + index // width for index in range(self.tables.size)]
+            if self.transpose[goalIndex[0]] != goalIndex[0]:
+                raise Exception("Reflection needs the goal blank on the main diagonal")
+            numbers = goal.numbers()
+            self.mirror = [numbers[self.transpose[goalIndex[tile]]] for tile in range(self.tables.size)]
+
+    def places(self, board):
+        "The board index of every tile of a packed board."
+        bits, size = self.tables.bits, self.tables.size
+        mask = (1 << bits) - 1
+        places = [0] * size
+        for index in range(size):
+            places[board & mask] = index
+            board >>= bits
+        return places
+
+    def total(self, places):
+        "The sum of the databases for tiles at the given places."
+        total = 0
+        for database in self.databases:
+            total += database.value([places[tile] for tile in database.pattern])
+        return total
+
+    def value(self, places):
+        if not self.reflect:
+            return self.total(places)
+        transpose, mirror = self.transpose, self.mirror
+        reflected = [transpose[places[mirror[tile]]] for tile in range(len(places))]
+        return max(self.total(places), self.total(reflected))
+
+    def __call__(self, state, problem=None):
+        return self.value(self.places(state.board))
+
+    def childValue(self, value, state, move):
+        "The value after 'move' from 'state', given the value at 'state'."
+        bits = self.tables.bits
+        target = state.blank + self.tables.offsets[move]
+        tile = (state.board >> (bits * target)) & ((1 << bits) - 1)
+        places = self.places(state.board)
+        if self.reflect:
+            places[tile], places[0] = state.blank, target
+            return self.value(places)
+        database = self.tileDatabase.get(tile)
+        if database is None:
+            return value
+        before = database.value([places[t] for t in database.pattern])
+        places[tile] = state.blank
+        return value - before + database.value([places[t] for t in database.pattern])
+
+def report(width, partition, samples=100000):
+    """
+      Prints the build time (when built now rather than loaded), size and
+    lookup cost of the databases of 'partition' for the goal with the blank
+    in the top-left corner of a width x width board.
+    """
+    size = width * width
+    goal = eightpuzzle.puzzleClass(width)(list(range(size)))
+    print("Pattern databases for width %d, partition %s" % (width, partition))
+    print("------------------------------------------------------------")
+    totalBytes = 0
+    for pattern in partition:
+        database = getPatternDatabase(goal, pattern)
+        placements = [random.sample(range(size), len(pattern)) for i in range(1000)]
+        start = time.time()
+        for i in range(samples // len(placements)):
+            for places in placements:
+                database.value(places)
+        lookup = (time.time() - start) / (samples // len(placements) * len(placements))
+        built = 'loaded' if database.buildTime is None else 'built in %.1f s' % database.buildTime
+        totalBytes += len(database.table)
+        print("%-30s %12d bytes  %-18s %6.2f us/lookup" % (pattern, len(database.table), built, lookup * 1e6))
+    print("total %d bytes" % totalBytes)
+    print()
+
+if __name__ == '__main__':
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    names = sys.argv[2:] or sorted(PARTITIONS[width])
+    for name in names:
+        report(width, PARTITIONS[width][name])
@@ -0,0 +1,208 @@
+# ranking.py
+# ----------
+# Perfect ranking of sliding-puzzle configurations.
+#
+# Only half of the permutations of the tiles can be reached from the goal, so
+# a configuration is ranked as (blank index, rank of the tile permutation among
+# the permutations of the reachable parity).  The result is a dense integer in
+# [0, numStates(width)), e.g. [0, 9!/2) for the eight puzzle, which can index
+# flat arrays and bitsets directly.
+#
+# moveTable, the moves of the blank on a board of any width, lives here too,
+# so that every puzzle module can share it.
+
+import math
+
+def permutationParity(perm):
+    "Returns 0 if perm has an even number of inversions and 1 otherwise."
+    parity = 0
+    size = len(perm)
+    for i in range(size):
+        value = perm[i]
+        for j in range(i + 1, size):
+            if perm[j] < value:
+                parity ^= 1
+    return parity
+
+def numPartialPermutations(count, size):
+    "Number of sequences of 'count' distinct values from 0..size-1."
+    return math.factorial(size) // math.factorial(size - count)
+
+def rankPartialPermutation(values, size):
+    """
+      Ranks a sequence of distinct values from 0..size-1, such as the places
+    of some of the tiles, in [0, numPartialPermutations(len(values), size)).
+    The digits are those of the Lehmer code, in a mixed radix of size,
+    size - 1, ...: each counts the smaller values not yet seen.
+
+    >>> rankPartialPermutation([0, 1], 4), rankPartialPermutation([3, 2], 4)
+    (0, 11)
+    """
+    rank = 0
+    seen = 0
+    for i in range(len(values)):
+        value = values[i]
+        digit = value - (seen & ((1 << value) - 1)).bit_count()
+        seen |= 1 << value
+        rank = rank * (size - i) + digit
+    return rank
+
+def unrankPartialPermutation(rank, count, size):
+    """
+      Inverse of rankPartialPermutation.
+
+    >>> unrankPartialPermutation(11, 2, 4)
+    [3, 2]
+    """
+    digits = []
+    for radix in range(size - count + 1, size + 1):
+        rank, digit = divmod(rank, radix)
+        digits.append(digit)
+    digits.reverse()
+    remaining = list(range(size))
+    return [remaining.pop(digit) for digit in digits]
+
+def rankPermutation(perm):
+    """
+      Returns the Lehmer-code rank of a permutation of 0..len(perm)-1, a
+    number in [0, len(perm)!).
+
+    >>> rankPermutation([0, 1, 2]), rankPermutation([2, 1, 0])
+    (0, 5)
+    """
+    return rankPartialPermutation(perm, len(perm))
+
+def unrankPermutation(rank, size):
+    """
+      Inverse of rankPermutation.
+
+    >>> unrankPermutation(5, 3)
+    [2, 1, 0]
+    """
+    return unrankPartialPermutation(rank, size, size)
+
+def rankHalfPermutation(perm):
+    """
+      Ranks a permutation among those of the same parity, giving a number in
+    [0, len(perm)!/2).  The last two values are implied by the others and
+    the parity, so only the rest are ranked, as a partial permutation.
+    """
+    return rankPartialPermutation(perm[:-2], len(perm))
+
+def unrankHalfPermutation(rank, size, parity):
+    """
+      Inverse of rankHalfPermutation for permutations of the given parity.
+
+    >>> perms = [unrankHalfPermutation(rank, 4, 1) for rank in range(12)]
+    >>> [rankHalfPermutation(perm) for perm in perms] == list(range(12))
+    True
+    >>> set(permutationParity(perm) for perm in perms)
+    {1}
+    """
+    perm = unrankPartialPermutation(rank, size - 2, size)
+    perm += sorted(set(range(size)) - set(perm))
+    if permutationParity(perm) != parity:
+        perm[-2], perm[-1] = perm[-1], perm[-2]
+    return perm
+
+def numStates(width):
+    "Number of configurations reachable from the goal on a width x width board."
+    return math.factorial(width * width) // 2
+
+def moveTable(width):
+    """
+      For every blank index of a width x width board, the (move, index)
+    pairs the blank may swap with, in the order 'up', 'down', 'left',
+    'right'.
+
+    >>> moveTable(3)[0], moveTable(3)[4][0]
+    ([('down', 3), ('right', 1)], ('up', 1))
+    """
+    table = []
+    for index in range(width * width):
+        row, col = divmod(index, width)
+        moves = []
+        if row > 0:
+            moves.append(('up', index - width))
+        if row < width - 1:
+            moves.append(('down', index + width))
+        if col > 0:
+            moves.append(('left', index - 1))
+        if col < width - 1:
+            moves.append(('right', index + 1))
+        table.append(moves)
+    return table
+
+def tileParity(blank, width):
+    """
+      The inversion parity of the tiles (blank excluded) that configurations
+    with the blank at the given index must have to be reachable from the goal
+    with the blank in the top-left corner.  On odd widths it is always even; on
+    even widths each vertical move changes it, so it follows the blank's row.
+    """
+    if width % 2:
+        return 0
+    return (blank // width) % 2
+
+def puzzleParity(numbers, width=3):
+    """
+      The parity that no move changes: the inversion parity of the tiles,
+    blank excluded, combined on even widths with the parity of the blank's
+    row.  Two configurations of the same tiles can reach each other if and
+    only if their parities are equal.
+    """
+    blank = numbers.index(0)
+    return permutationParity([tile for tile in numbers if tile != 0]) ^ tileParity(blank, width)
+
+def isSolvable(numbers, width=3):
+    """
+      True if the configuration can reach the goal with the blank in the
+    top-left corner and the tiles in order, which has parity 0.
+
+    >>> isSolvable([0, 1, 2, 3, 4, 5, 6, 7, 8]), isSolvable([0, 2, 1, 3, 4, 5, 6, 7, 8])
+    (True, False)
+    >>> isSolvable([4, 1, 2, 3, 0, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], 4)
+    True
+    >>> isSolvable([0, 2, 1, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], 4)
+    False
+    """
+    return puzzleParity(numbers, width) == 0
+
+def rankPuzzle(numbers, width=3):
+    """
+      Maps a reachable configuration, given as a flat row-major list with 0 for
+    the blank, to a dense rank in [0, numStates(width)).
+
+    >>> rankPuzzle([0, 1, 2, 3, 4, 5, 6, 7, 8])
+    0
+    >>> unrankPuzzle(rankPuzzle([1, 7, 8, 2, 3, 4, 5, 6, 0]))
+    [1, 7, 8, 2, 3, 4, 5, 6, 0]
+    """
+    blank = numbers.index(0)
+    tiles = [tile - 1 for tile in numbers if tile != 0]
+    return blank * (math.factorial(len(tiles)) // 2) + rankHalfPermutation(tiles)
+
+def rankBoard(board, blank, width=3, bits=4):
+    """
+      rankPuzzle for a configuration packed into an integer, 'bits' bits per
+    tile in row-major order, with the blank at index 'blank'.
+    """
+    size = width * width
+    mask = (1 << bits) - 1
+    tiles = size - 1
+    values = []
+    for index in range(size):
+        if len(values) == tiles - 2:
+            break
+        if index != blank:
+            values.append(((board >> (bits * index)) & mask) - 1)
+    return blank * (math.factorial(tiles) // 2) + rankPartialPermutation(values, tiles)
+
+def unrankPuzzle(rank, width=3):
+    "Inverse of rankPuzzle."
+    size = width * width
+    blank, rank = divmod(rank, math.factorial(size - 1) // 2)
+    tiles = unrankHalfPermutation(rank, size - 1, tileParity(blank, width))
+    numbers = [tile + 1 for tile in tiles]
+    numbers.insert(blank, 0)
+    return numbers
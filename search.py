@@ -19,6 +19,7 @@ Pacman agents (in searchAgents.py).
 
 import util
 import math
+import time
 class SearchProblem:
     """
     This class outlines the structure of a search problem, but doesn't implement
@@ -50,6 +51,18 @@ class SearchProblem:
         """
         util.raiseNotDefined()
 
+    def iterSuccessors(self, state, lastAction=None):
+        """
+          state: Search state
+          lastAction: the action that led to 'state', or None at the start
+
+        Yields the (successor, action, stepCost) triples of getSuccessors one
+        at a time.  Problems whose actions can be undone may override this to
+        build each successor only when it is asked for, and to leave out the
+        action that undoes lastAction, which can only lead back.
+        """
+        return iter(self.getSuccessors(state))
+
     def getCostOfActions(self, actions):
         """
          actions: A list of actions to take
@@ -59,6 +72,137 @@ class SearchProblem:
         """
         util.raiseNotDefined()
 
+    def getGoalState(self):
+        """
+        Returns the single goal state, for searches that also work backwards
+        from the goal.
+        """
+        util.raiseNotDefined()
+
+    def getPredecessors(self, state):
+        """
+          state: Search state
+
+        For a given state, this should return a list of triples, (predecessor,
+        action, stepCost), where taking 'action' in 'predecessor' leads to
+        'state' at a cost of 'stepCost'.
+        """
+        util.raiseNotDefined()
+
+
+class RankedStateSet:
+    """
+      A set of states kept as a bitset over the dense state ranks a problem
+    provides through getStateRank and getStateSpaceSize.
+    """
+    def __init__(self, problem):
+        self.getRank = problem.getStateRank
+        self.bits = util.Bitset(problem.getStateSpaceSize())
+
+    def add(self, state):
+        self.bits.add(self.getRank(state))
+
+    def __contains__(self, state):
+        return self.getRank(state) in self.bits
+
+    def __len__(self):
+        return len(self.bits)
+
+# Largest state space given a RankedStateSet, whose bitset takes a bit per
+# state (32 MB here); the fifteen puzzle's 16!/2 states get a plain set
+MAX_RANKED_STATES = 1 << 28
+
+def newVisitedSet(problem):
+    """
+      Returns an empty set for visited states: a RankedStateSet when the
+    problem can rank its states and there are at most MAX_RANKED_STATES of
+    them, and a plain set otherwise.
+    """
+    if (hasattr(problem, 'getStateRank') and hasattr(problem, 'getStateSpaceSize')
+            and problem.getStateSpaceSize() <= MAX_RANKED_STATES):
+        return RankedStateSet(problem)
+    return set()
+
+class UnsolvablePuzzle(Exception):
+    """
+      Raised by the searches when the problem's isSolvable() says the goal
+    cannot be reached, rather than returning a None path after exhausting
+    the state space, so that callers can tell the two apart.
+    """
+    pass
+
+def _checkSolvable(problem):
+    """
+      Raises UnsolvablePuzzle if the problem has an isSolvable() method and
+    it says the goal cannot be reached.
+    """
+    isSolvable = getattr(problem, 'isSolvable', None)
+    if isSolvable is not None and not isSolvable():
+        raise UnsolvablePuzzle('the goal cannot be reached from the start state')
+
+class SearchNode:
+    """
+      A node in the search tree: a state, the node it was generated from, the
+    action taken there, the path cost g and the depth.  Nodes share their
+    common prefixes through parent pointers, and the action list is rebuilt
+    only once, by path(), when a goal is reached.  Informed searches cache
+    the heuristic value of the state in h.
+    """
+    __slots__ = ('state', 'parent', 'action', 'g', 'depth', 'h')
+
+    def __init__(self, state, parent=None, action=None, g=0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.g = g
+        self.h = None
+        if parent is None:
+            self.depth = 0
+        else:
+            self.depth = parent.depth + 1
+
+    def child(self, state, action, stepCost):
+        "Returns the node reached from this one by taking 'action'."
+        return SearchNode(state, self, action, self.g + stepCost)
+
+    def path(self):
+        "Returns the list of actions leading from the root to this node."
+        actions = []
+        node = self
+        while node.parent is not None:
+            actions.append(node.action)
+            node = node.parent
+        actions.reverse()
+        return actions
+
+class BackwardProblem(SearchProblem):
+    """
+      The search problem of reaching 'problem's start state from its goal
+    state, following getPredecessors instead of getSuccessors.  Searching it
+    exhaustively gives every state's distance to the goal.
+    """
+    def __init__(self, problem):
+        self.problem = problem
+        if hasattr(problem, 'getStateRank') and hasattr(problem, 'getStateSpaceSize'):
+            self.getStateRank = problem.getStateRank
+            self.getStateSpaceSize = problem.getStateSpaceSize
+        if hasattr(problem, 'isSolvable'):
+            self.isSolvable = problem.isSolvable
+
+    def getStartState(self):
+        return self.problem.getGoalState()
+
+    def isGoalState(self, state):
+        return state == self.problem.getStartState()
+
+    def getGoalState(self):
+        return self.problem.getStartState()
+
+    def getSuccessors(self, state):
+        return self.problem.getPredecessors(state)
+
+    def getPredecessors(self, state):
+        return self.problem.getSuccessors(state)
 
 def tinyMazeSearch(problem):
     """
@@ -72,71 +216,130 @@ def tinyMazeSearch(problem):
 
 #/*=====Start Change Task 1=====*/
 
-def depthFirstSearch(problem):
-    """Search the deepest nodes in the search tree first."""
+def depthFirstSearch(problem, maxNodes=None, pruneDuplicates=True):
+    """
+      Search the deepest nodes in the search tree first, as an iterative
+    deepening search: depth-limited searches with the limit raised by one
+    each time, so the first goal found is a shallowest one.  A state is not
+    revisited while it is on the current path, and only that path is kept,
+    so memory grows with the depth rather than with the states seen.
+
+    maxNodes, if given, caps the number of expansions over all iterations.
+    If pruneDuplicates is set and the problem has getDuplicatePruning(), the
+    moves that complete a duplicate move sequence are skipped, as in
+    idaStarSearch.
+
+    Returns [actions, maxFringe, maxDepth, explored, success]: success is 1
+    when a goal is found and 0, with actions None, when the state space is
+    exhausted or the node budget runs out.  maxFringe is the longest path
+    held.  Like the other searches, it raises UnsolvablePuzzle for a problem
+    that reports itself unsolvable.
+
+      The paths found are as short as breadth-first search's, with or
+    without pruning:
+
+    >>> import eightpuzzle
+    >>> def reaches(problem, actions):
+    ...     state = problem.getStartState()
+    ...     for action in actions:
+    ...         state = dict([(a, s) for s, a, c in problem.getSuccessors(state)])[action]
+    ...     return problem.isGoalState(state)
+    >>> for number in (0, 2, 3, 4, 5):
+    ...     problem = eightpuzzle.EightPuzzleSearchProblem(eightpuzzle.loadEightPuzzle(number))
+    ...     shortest = len(breadthFirstSearch(problem)[0])
+    ...     for prune in (True, False):
+    ...         actions, maxFringe, maxDepth, explored, success = depthFirstSearch(problem, pruneDuplicates=prune)
+    ...         assert success == 1 and len(actions) == shortest and reaches(problem, actions)
+    """
+
+    _checkSolvable(problem)
 
-    # states to be explored (LIFO). holds nodes in form (state, action)
-    frontier = util.Stack()
-    # previously explored states (for path checking), holds states
-    exploredNodes = []
-    #define start node
     startState = problem.getStartState()
-    startNode = (startState, [])
-    
-    frontier.push(startNode)
 
-    n = 1
+    automaton = None
+    if pruneDuplicates and hasattr(problem, 'getDuplicatePruning'):
+        automaton = problem.getDuplicatePruning()
+    startPrune = automaton.start(startState) if automaton is not None else None
+
+    explored = 0
     maxFringe = 0
     maxDepth = 0
+    limit = 0
 
-    while not frontier.isEmpty():
+    while True:
+        #set when a node is left unexpanded by the depth limit
+        cutoff = False
 
-        if (n>=maxFringe):
-            maxFringe = n
+        #current path as (SearchNode, successor iterator, automaton state)
+        #triples, LIFO
+        stack = [(SearchNode(startState), None, startPrune)]
+        #states on the current path (for cycle checking)
+        onPath = set([startState])
 
+        while stack:
 
-        #begin exploring last (most-recently-pushed) node on frontier
-        currentState, actions = frontier.pop()
-        n -= 1
+            if (len(stack) > maxFringe):
+                maxFringe = len(stack)
 
-        if(len(actions) > maxDepth):
-            maxDepth = len(actions)
-        
-        if currentState not in exploredNodes:
-            if len(actions) < 10:
-                #mark current node as explored
-                exploredNodes.append(currentState)
+            node, successors, pruneState = stack[-1]
 
-                if problem.isGoalState(currentState):
-                    return [actions, maxFringe, maxDepth, len(exploredNodes), 1]
-                else:
-                    #get list of possible successor nodes in
-                    #form (successor, action, stepCost)
-                    successors = problem.getSuccessors(currentState)
+            if successors is None:
+                if problem.isGoalState(node.state):
+                    return [node.path(), maxFringe, maxDepth, explored, 1]
+
+                if node.depth == limit:
+                    cutoff = True
+                    stack.pop()
+                    onPath.discard(node.state)
+                    continue
 
-                    #push each successor to frontier
-                    for succState, succAction, succCost in successors:
-                        newAction = actions + [succAction]
-                        newNode = (succState, newAction)
-                        frontier.push(newNode)
-                        n +=1
+                if maxNodes is not None and explored >= maxNodes:
+                    return [None, maxFringe, maxDepth, explored, 0]
 
-    return [actions, maxFringe, maxDepth, len(exploredNodes), 0]
+                explored += 1
+                successors = iter(problem.getSuccessors(node.state))
+                stack[-1] = (node, successors, pruneState)
+
+            #descend into the next successor not already on the path and
+            #not completing a duplicate move sequence
+            for succState, succAction, succCost in successors:
+                if succState in onPath:
+                    continue
+                if automaton is not None:
+                    nextState = automaton.step(pruneState, succAction)
+                    if nextState is None:
+                        continue
+                else:
+                    nextState = None
+                child = node.child(succState, succAction, succCost)
+                if (child.depth > maxDepth):
+                    maxDepth = child.depth
+                onPath.add(succState)
+                stack.append((child, None, nextState))
+                break
+            else:
+                stack.pop()
+                onPath.discard(node.state)
+
+        if not cutoff:
+            return [None, maxFringe, maxDepth, explored, 0]
+        limit += 1
 
 def breadthFirstSearch(problem):
     """Search the shallowest nodes in the search tree first."""
 
+    _checkSolvable(problem)
+
     n = 0
-    #to be explored (FIFO)
+    #to be explored (FIFO), holds SearchNodes
     frontier = util.Queue()
     
     #previously expanded states (for cycle checking), holds states
-    exploredNodes = []
+    exploredNodes = newVisitedSet(problem)
     
-    startState = problem.getStartState()
-    startNode = (startState, [], 0) #(state, action, cost)
+    node = SearchNode(problem.getStartState())
     
-    frontier.push(startNode)
+    frontier.push(node)
     n += 1
     maxFringe = 0;
     maxDepth = 0;
@@ -147,82 +350,208 @@ def breadthFirstSearch(problem):
             maxFringe = n
 
         #begin exploring first (earliest-pushed) node on frontier
-        currentState, actions, currentCost = frontier.pop()
+        node = frontier.pop()
+        currentState = node.state
         n -= 1
 
-        if (len(actions) > maxDepth):
-            maxDepth = len(actions)
+        if (node.depth > maxDepth):
+            maxDepth = node.depth
 
         if currentState not in exploredNodes:
-            #put popped node state into explored list
-            exploredNodes.append(currentState)
+            #put popped node state into explored set
+            exploredNodes.add(currentState)
 
             if problem.isGoalState(currentState):
-                return [actions, maxFringe, maxDepth, len(exploredNodes)]
+                return [node.path(), maxFringe, maxDepth, len(exploredNodes)]
             else:
                 #list of (successor, action, stepCost)
                 successors = problem.getSuccessors(currentState)
                 
                 for succState, succAction, succCost in successors:
-                    newAction = actions + [succAction]
-                    newCost = currentCost + succCost
-                    newNode = (succState, newAction, newCost)
-
-                    frontier.push(newNode)
+                    frontier.push(node.child(succState, succAction, succCost))
                     n+=1
 
-    return actions
+    return [None, maxFringe, maxDepth, len(exploredNodes)]
         
+def breadthFirstLayers(problem):
+    """
+      Generates the layers of a breadth-first sweep from the start state: lists
+    of SearchNodes, one list per depth.  Each state appears in exactly one
+    layer, since duplicates are dropped as soon as they are generated, using
+    the problem's rank-indexed visited set when it has one.
+    """
+    visited = newVisitedSet(problem)
+    startState = problem.getStartState()
+    visited.add(startState)
+    layer = [SearchNode(startState)]
+
+    while layer:
+        yield layer
+        nextLayer = []
+        for node in layer:
+            for succState, succAction, succCost in problem.getSuccessors(node.state):
+                if succState not in visited:
+                    visited.add(succState)
+                    nextLayer.append(node.child(succState, succAction, succCost))
+        layer = nextLayer
+
+def layeredBreadthFirstSearch(problem, reportLayer=None):
+    """
+      Breadth-first search one layer at a time (see breadthFirstLayers).
+    reportLayer, if given, is called as reportLayer(depth, size) as each
+    layer is reached.  Returns [actions, maxFringe, maxDepth, explored] like
+    breadthFirstSearch, with actions None when no goal is reachable.
+    """
+    _checkSolvable(problem)
+
+    maxFringe = 0
+    maxDepth = 0
+    explored = 0
+
+    for layer in breadthFirstLayers(problem):
+        depth = layer[0].depth
+        if reportLayer is not None:
+            reportLayer(depth, len(layer))
+        if (maxFringe < len(layer)):
+            maxFringe = len(layer)
+        maxDepth = depth
+
+        for node in layer:
+            explored += 1
+            if problem.isGoalState(node.state):
+                return [node.path(), maxFringe, maxDepth, explored]
+
+    return [None, maxFringe, maxDepth, explored]
+
+def _backwardPath(node):
+    "Actions leading from a node of a backward search to its root, the goal."
+    actions = []
+    while node.parent is not None:
+        actions.append(node.action)
+        node = node.parent
+    return actions
+
+def bidirectionalSearch(problem):
+    """
+      Breadth-first search from the start state and, through getPredecessors,
+    from problem.getGoalState() at the same time, one layer at a time on the
+    side with the smaller frontier, until the two searches meet.
+
+    Returns [actions, maxFringe, maxDepth, explored] like breadthFirstSearch,
+    where maxFringe counts both frontiers, maxDepth is the deepest layer of
+    either search and actions is None when no goal is reachable.
+
+      The paths found are as short as breadth-first search's:
+
+    >>> import eightpuzzle
+    >>> def reaches(problem, actions):
+    ...     state = problem.getStartState()
+    ...     for action in actions:
+    ...         state = dict([(a, s) for s, a, c in problem.getSuccessors(state)])[action]
+    ...     return problem.isGoalState(state)
+    >>> for number in (0, 2, 3, 4, 5):
+    ...     problem = eightpuzzle.EightPuzzleSearchProblem(eightpuzzle.loadEightPuzzle(number))
+    ...     actions = bidirectionalSearch(problem)[0]
+    ...     assert len(actions) == len(breadthFirstSearch(problem)[0]) and reaches(problem, actions)
+    """
+    _checkSolvable(problem)
+
+    startState = problem.getStartState()
+    goalState = problem.getGoalState()
+
+    #reached states of each search, holds state:SearchNode
+    reached = [{startState: SearchNode(startState)}, {goalState: SearchNode(goalState)}]
+    layers = [[reached[0][startState]], [reached[1][goalState]]]
+    expand = [problem.getSuccessors, problem.getPredecessors]
+
+    maxFringe = 2
+    maxDepth = 0
+    explored = 0
+
+    if startState in reached[1]:
+        return [[], maxFringe, maxDepth, explored]
+
+    while layers[0] and layers[1]:
+        side = 0 if len(layers[0]) <= len(layers[1]) else 1
+        other = 1 - side
+
+        #expand the whole layer, keeping the shortest connection through it
+        best = None
+        nextLayer = []
+        for node in layers[side]:
+            explored += 1
+            for succState, succAction, succCost in expand[side](node.state):
+                if succState in reached[side]:
+                    continue
+                child = node.child(succState, succAction, succCost)
+                reached[side][succState] = child
+                nextLayer.append(child)
+                if succState in reached[other]:
+                    meeting = reached[other][succState]
+                    if best is None or child.depth + meeting.depth < best[0].depth + best[1].depth:
+                        best = (child, meeting)
+        layers[side] = nextLayer
+
+        if (maxFringe < len(layers[0]) + len(layers[1])):
+            maxFringe = len(layers[0]) + len(layers[1])
+        if nextLayer and nextLayer[0].depth > maxDepth:
+            maxDepth = nextLayer[0].depth
+
+        if best is not None:
+            forwardNode, backwardNode = best if side == 0 else (best[1], best[0])
+            return [forwardNode.path() + _backwardPath(backwardNode), maxFringe, maxDepth, explored]
+
+    return [None, maxFringe, maxDepth, explored]
+
 def uniformCostSearch(problem):
     """Search the node of least total cost first."""
 
+    _checkSolvable(problem)
 
-    #to be explored (FIFO): holds (item, cost)
-    frontier = util.PriorityQueue()
+    #to be explored (lowest cost first): holds (node, cost), at most one node per state
+    frontier = util.KeyedPriorityQueue(lambda node: node.state)
 
     #previously expanded states (for cycle checking), holds state:cost
     exploredNodes = {}
     
-    startState = problem.getStartState()
-    startNode = (startState, [], 0) #(state, action, cost)
+    node = SearchNode(problem.getStartState())
     
-    frontier.push(startNode, 0)
+    frontier.push(node, 0)
 
-    n = 1
     maxFringe = 0
     maxDepth = 0
 
     while not frontier.isEmpty():
 
-        if (maxFringe < n):
-            maxFringe = n
+        if (maxFringe < len(frontier)):
+            maxFringe = len(frontier)
 
         #begin exploring first (lowest-cost) node on frontier
-        currentState, actions, currentCost = frontier.pop()
-        n -= 1
+        node = frontier.pop()
+        currentState, currentCost = node.state, node.g
 
-        if(len(actions) > maxDepth):
-            maxDepth = len(actions)
+        if(node.depth > maxDepth):
+            maxDepth = node.depth
 
         if (currentState not in exploredNodes) or (currentCost < exploredNodes[currentState]):
             #put popped node's state into explored list
             exploredNodes[currentState] = currentCost
 
             if problem.isGoalState(currentState):
-                return [actions, maxFringe, maxDepth, len(exploredNodes)]
+                return [node.path(), maxFringe, maxDepth, len(exploredNodes)]
             else:
                 #list of (successor, action, stepCost)
                 successors = problem.getSuccessors(currentState)
                 
                 for succState, succAction, succCost in successors:
-                    newAction = actions + [succAction]
                     newCost = currentCost + succCost
-                    newNode = (succState, newAction, newCost)
+                    if succState in exploredNodes and newCost >= exploredNodes[succState]:
+                        continue
 
-                    frontier.update(newNode, newCost)
-                    n += 1
+                    #decrease-key if the state is already queued at a higher cost
+                    frontier.update(node.child(succState, succAction, succCost), newCost)
 
-    return actions
+    return [None, maxFringe, maxDepth, len(exploredNodes)]
 
 def nullHeuristic(state, problem=None):
     """
@@ -234,15 +563,27 @@ def nullHeuristic(state, problem=None):
 def aStarSearch(problem, heuristic=nullHeuristic):
     """Search the node that has the lowest combined cost and heuristic first."""
 
-    #to be explored (FIFO): takes in item, cost+heuristic
+    _checkSolvable(problem)
+
+    #to be explored (FIFO): takes in node, cost+heuristic
     frontier = util.PriorityQueue()
 
-    exploredNodes = [] #holds (state, cost)
+    #cheapest cost found so far to reach each generated state, holds state:cost
+    bestCosts = {}
+    #number of popped nodes, superseded ones included, plus generated nodes,
+    #as reported in the result
+    explored = 0
 
-    startState = problem.getStartState()
-    startNode = (startState, [], 0) #(state, action, cost)
+    #heuristics that can derive a child's value from its parent's
+    childValue = getattr(heuristic, 'childValue', None)
+    #problems that generate successors one at a time
+    iterSuccessors = getattr(problem, 'iterSuccessors', None)
+
+    node = SearchNode(problem.getStartState())
+    node.h = heuristic(node.state, problem)
 
-    frontier.push(startNode, 0)
+    frontier.push(node, 0)
+    bestCosts[node.state] = 0
 
     n = 1
     maxFringe = 0
@@ -254,121 +595,649 @@ def aStarSearch(problem, heuristic=nullHeuristic):
             maxFringe = n
 
         #begin exploring first (lowest-combined (cost+heuristic) ) node on frontier
-        currentState, actions, currentCost = frontier.pop()
+        node = frontier.pop()
+        currentState, currentCost = node.state, node.g
         n -= 1
 
-        if(len(actions) > maxDepth):
-            maxDepth = len(actions)
+        if(node.depth > maxDepth):
+            maxDepth = node.depth
+
+        explored += 1
 
-        #put popped node into explored list
-        exploredNodes.append((currentState, currentCost))
+        #skip entries superseded by a cheaper path pushed later; they are
+        #still counted, as the original search counted every pop
+        if currentCost > bestCosts[currentState]:
+            continue
 
         if problem.isGoalState(currentState):
-            return [actions, maxFringe, maxDepth, len(exploredNodes)]
+            return [node.path(), maxFringe, maxDepth, explored]
 
         else:
-            #list of (successor, action, stepCost)
-            successors = problem.getSuccessors(currentState)
+            #(successor, action, stepCost) triples, generated lazily without
+            #the move straight back to the parent where the problem allows
+            if iterSuccessors is not None:
+                successors = iterSuccessors(currentState, node.action)
+            else:
+                successors = problem.getSuccessors(currentState)
 
             #examine each successor
             for succState, succAction, succCost in successors:
-                newAction = actions + [succAction]
-                newCost = problem.getCostOfActions(newAction)
-                newNode = (succState, newAction, newCost)
+                newCost = currentCost + succCost
 
-                #check if this successor has been explored
-                already_explored = False
-                for explored in exploredNodes:
-                    #examine each explored node tuple
-                    exploredState, exploredCost = explored
+                #skip successors already reached at least as cheaply; a cheaper
+                #path reopens the state even if it was already expanded
+                if succState in bestCosts and newCost >= bestCosts[succState]:
+                    continue
 
-                    if (succState == exploredState) and (newCost >= exploredCost):
-                        already_explored = True
+                child = node.child(succState, succAction, succCost)
+                if childValue is not None:
+                    child.h = childValue(node.h, currentState, succAction)
+                else:
+                    child.h = heuristic(succState, problem)
+                frontier.push(child, newCost + child.h)
+                bestCosts[succState] = newCost
+                explored += 1
+                n += 1
 
-                #if this successor not explored, put on frontier and explored list
-                if not already_explored:
-                    frontier.push(newNode, newCost + heuristic(succState, problem))
-                    exploredNodes.append((succState, newCost))
-                    n += 1
+    return [None, maxFringe, maxDepth, explored]
 
-    return actions
 
+def bidirectionalAStarSearch(problem, heuristic=nullHeuristic, backwardHeuristic=nullHeuristic):
+    """
+      A* from the start state towards problem.getGoalState(), guided by
+    'heuristic', and at the same time from the goal back towards the start
+    through getPredecessors, guided by 'backwardHeuristic' (an estimate of
+    the distance to the start state).  Each step expands the side with the
+    smaller f.  The search stops once the cheapest path found through a
+    state reached from both sides costs no more than the larger of the two
+    smallest f values, which is optimal for admissible heuristics.
+
+    Returns [actions, maxFringe, maxDepth, explored] like aStarSearch, where
+    maxFringe counts both frontiers.  explored counts expansions only, while
+    aStarSearch counts popped plus generated nodes.
+
+      The paths found are as short as breadth-first search's, with or
+    without heuristics:
+
+    >>> import eightpuzzle
+    >>> def reaches(problem, actions):
+    ...     state = problem.getStartState()
+    ...     for action in actions:
+    ...         state = dict([(a, s) for s, a, c in problem.getSuccessors(state)])[action]
+    ...     return problem.isGoalState(state)
+    >>> for number in (0, 2, 3, 4, 5):
+    ...     start = eightpuzzle.loadEightPuzzle(number)
+    ...     problem = eightpuzzle.EightPuzzleSearchProblem(start)
+    ...     forward, backward = ManhattanHeuristic(problem.getGoalState()), ManhattanHeuristic(start)
+    ...     for heuristics in ((), (forward,), (forward, backward)):
+    ...         actions = bidirectionalAStarSearch(problem, *heuristics)[0]
+    ...         assert len(actions) == len(breadthFirstSearch(problem)[0]) and reaches(problem, actions)
+    """
+    _checkSolvable(problem)
 
-def h1test(current_state, glstate):
+    startState = problem.getStartState()
+    goalState = problem.getGoalState()
+
+    frontiers = [util.PriorityQueue(), util.PriorityQueue()]
+    #cheapest node found so far for each state, per side, holds state:SearchNode
+    bestNodes = [{startState: SearchNode(startState)}, {goalState: SearchNode(goalState)}]
+    heuristics = [heuristic, backwardHeuristic]
+    expand = [problem.getSuccessors, problem.getPredecessors]
+
+    frontiers[0].push(bestNodes[0][startState], heuristic(startState, problem))
+    frontiers[1].push(bestNodes[1][goalState], backwardHeuristic(goalState, problem))
+
+    #cheapest connection found so far, as (cost, forward node, backward node)
+    best = (float('inf'), None, None)
+    if startState in bestNodes[1]:
+        best = (0, bestNodes[0][startState], bestNodes[1][startState])
+
+    n = 2
+    maxFringe = 0
+    maxDepth = 0
+    explored = 0
+
+    while True:
+        #drop entries superseded by a cheaper path pushed later
+        for side in (0, 1):
+            frontier = frontiers[side]
+            while not frontier.isEmpty() and frontier.peek() is not bestNodes[side][frontier.peek().state]:
+                frontier.pop()
+                n -= 1
+        if frontiers[0].isEmpty() or frontiers[1].isEmpty():
+            break
+
+        fMin = [frontiers[0].minPriority(), frontiers[1].minPriority()]
+        if best[0] <= max(fMin):
+            break
+
+        if (maxFringe < n):
+            maxFringe = n
+
+        side = 0 if fMin[0] <= fMin[1] else 1
+        other = 1 - side
+        node = frontiers[side].pop()
+        n -= 1
+        explored += 1
+        if (node.depth > maxDepth):
+            maxDepth = node.depth
+
+        for succState, succAction, succCost in expand[side](node.state):
+            newCost = node.g + succCost
+            if succState in bestNodes[side] and newCost >= bestNodes[side][succState].g:
+                continue
+            child = node.child(succState, succAction, succCost)
+            bestNodes[side][succState] = child
+            frontiers[side].push(child, newCost + heuristics[side](succState, problem))
+            n += 1
+
+            if succState in bestNodes[other]:
+                meeting = bestNodes[other][succState]
+                if newCost + meeting.g < best[0]:
+                    best = (newCost + meeting.g, child, meeting) if side == 0 else (newCost + meeting.g, meeting, child)
+
+    if best[1] is None:
+        return [None, maxFringe, maxDepth, explored]
+    return [best[1].path() + _backwardPath(best[2]), maxFringe, maxDepth, explored]
+
+def greedyDescentSearch(problem, heuristic):
+    """
+      Follows a perfect heuristic -- the exact cost to the goal, such as a
+    distancedb.DistanceDatabase -- down to the goal without searching: from
+    each state it takes the first successor whose heuristic value plus the
+    step cost equals the state's own.
+
+    Returns [actions, maxFringe, maxDepth, explored] like aStarSearch, with
+    actions None when the heuristic offers no such successor.
+    """
+    _checkSolvable(problem)
+
+    node = SearchNode(problem.getStartState())
+    h = heuristic(node.state, problem)
+    explored = 0
+
+    while not problem.isGoalState(node.state):
+        explored += 1
+        for succState, succAction, succCost in problem.getSuccessors(node.state):
+            succH = heuristic(succState, problem)
+            if succH + succCost == h:
+                node = node.child(succState, succAction, succCost)
+                h = succH
+                break
+        else:
+            return [None, 1, node.depth, explored]
+
+    return [node.path(), 1, node.depth, explored]
+
+def idaStarSearch(problem, heuristic=nullHeuristic, pruneDuplicates=True):
+    """
+      Iterative deepening A*: depth-first searches bounded by f = g + h, with
+    the bound raised to the smallest f that exceeded it until a goal is found.
+    Only the current path is kept, so memory grows linearly with depth.
+
+    If the problem provides getStartBoard(), a mutable board with
+    legalMoves(), move(action), undo(action), inverse(action) and isGoal(),
+    the search moves that board and every move costs 1.  The move that
+    undoes the previous one is never tried.  If the heuristic has a
+    childValue(value, board, action) method (see TableHeuristic) it is
+    updated incrementally as the board moves; otherwise it is evaluated on
+    board.state() at each node, through its bounded(state, problem, limit)
+    method if it has one (see MaxHeuristic), with the limit beyond which the
+    node is pruned.
+
+    Other problems are searched state by state through iterSuccessors(state,
+    lastAction), so that the siblings left after a goal is found are never
+    built, or through getSuccessors if they lack it.
+
+    If pruneDuplicates is set and the problem has getDuplicatePruning(), an
+    automaton with start(board) and step(state, action) (see movepruning.py),
+    the moves that complete a sequence with a shorter or earlier equivalent
+    are skipped too.
+
+    Returns [actions, maxFringe, maxDepth, explored] like aStarSearch, where
+    maxFringe is the longest path held and explored counts node expansions.
+
+      The paths found are as short as breadth-first search's, on the board
+    and, through BackwardProblem, which has no board, state by state:
+
+    >>> import eightpuzzle
+    >>> def reaches(problem, actions):
+    ...     state = problem.getStartState()
+    ...     for action in actions:
+    ...         state = dict([(a, s) for s, a, c in problem.getSuccessors(state)])[action]
+    ...     return problem.isGoalState(state)
+    >>> for number in (0, 2, 3, 4, 5):
+    ...     start = eightpuzzle.loadEightPuzzle(number)
+    ...     problem = eightpuzzle.EightPuzzleSearchProblem(start)
+    ...     backward = BackwardProblem(problem)
+    ...     shortest = len(breadthFirstSearch(problem)[0])
+    ...     for prune in (True, False):
+    ...         for searched, goal in ((problem, problem.getGoalState()), (backward, start)):
+    ...             actions = idaStarSearch(searched, ManhattanHeuristic(goal), prune)[0]
+    ...             assert len(actions) == shortest and reaches(searched, actions)
+    """
+    _checkSolvable(problem)
+
+    automaton = None
+    if pruneDuplicates and hasattr(problem, 'getDuplicatePruning'):
+        automaton = problem.getDuplicatePruning()
+    childValue = getattr(heuristic, 'childValue', None)
+
+    if hasattr(problem, 'getStartBoard'):
+        board = problem.getStartBoard()
+
+        def successors(board, lastMove):
+            undoMove = None if lastMove is None else board.inverse(lastMove)
+            return [(board, move, 1) for move in board.legalMoves() if move != undoMove]
+
+        return _idaStar(problem, heuristic, automaton, childValue, board, successors,
+                        lambda board: board.isGoal(), lambda board: board.state(),
+                        board.move, board.undo)
+
+    #childValue, like the automaton, takes each action for a move of the
+    #blank, which the actions of other problems (those of a BackwardProblem,
+    #for one) need not be
+    if not hasattr(problem, 'getDuplicatePruning'):
+        childValue = None
+    successors = getattr(problem, 'iterSuccessors', None)
+    if successors is None:
+        successors = lambda state, lastAction: problem.getSuccessors(state)
+    return _idaStar(problem, heuristic, automaton, childValue, problem.getStartState(),
+                    successors, problem.isGoalState, lambda state: state)
+
+def _idaStar(problem, heuristic, automaton, childValue, root, successors, isGoal, stateOf,
+             move=None, undo=None):
+    """
+      The iterations of idaStarSearch, over nodes that are either states or
+    one mutable board.  successors(node, lastAction) gives the (child,
+    action, stepCost) triples of a node; a board is its own child, made by
+    move(action) before the child is searched and undo(action) after.
+    stateOf(node) is the state the heuristic is evaluated on, and
+    childValue, if not None, updates it from the parent node and action
+    before the move.
+    """
+    bounded = getattr(heuristic, 'bounded', None)
+    path = []
+    FOUND = -1
+    maxDepth = 0
+    explored = 0
+
+    def boundedSearch(node, g, h, depth, lastAction, pruneState, bound):
+        nonlocal maxDepth, explored
+        f = g + h
+        if f > bound:
+            return f
+        if depth > maxDepth:
+            maxDepth = depth
+        explored += 1
+        if isGoal(node):
+            return FOUND
+
+        smallest = float('inf')
+        for child, action, stepCost in successors(node, lastAction):
+            if automaton is not None:
+                nextState = automaton.step(pruneState, action)
+                if nextState is None:
+                    continue
+            else:
+                nextState = None
+            if childValue is not None:
+                childH = childValue(h, node, action)
+            if move is not None:
+                move(action)
+            if childValue is None:
+                if bounded is not None:
+                    childH = bounded(stateOf(child), problem, bound - g - stepCost)
+                else:
+                    childH = heuristic(stateOf(child), problem)
+            path.append(action)
+            t = boundedSearch(child, g + stepCost, childH, depth + 1, action, nextState, bound)
+            if t == FOUND:
+                return FOUND
+            path.pop()
+            if undo is not None:
+                undo(action)
+            if t < smallest:
+                smallest = t
+        return smallest
+
+    startH = heuristic(stateOf(root), problem)
+    startPrune = automaton.start(root) if automaton is not None else None
+    bound = startH
+    while True:
+        t = boundedSearch(root, 0, startH, 0, None, startPrune, bound)
+        if t == FOUND:
+            return [path, maxDepth + 1, maxDepth, explored]
+        if t == float('inf'):
+            return [None, maxDepth + 1, maxDepth, explored]
+        bound = t
+
+class GoalTables:
+    """
+      Lookup tables for one goal configuration, built once so that each
+    heuristic below costs one table lookup per board cell instead of a
+    search of the goal board for every tile.  Each table is indexed as
+    table[tile][index], for the tile at row-major board index 'index':
+
+      goalIndex[tile]  the index of the tile in the goal
+      misplaced        1 if the goal holds another tile there (blank included)
+      euclidean        straight-line distance from the tile's goal place
+      manhattan        Manhattan distance from the tile's goal place
+      outOfLine        1 for being out of the goal row, plus 1 for being out
+                       of the goal column
+
+    The blank's rows are zero except in 'misplaced'.
+    """
+    def __init__(self, goal):
+        numbers = goal.numbers()
+        self.size = len(numbers)
+        self.width = goal.width
+        self.bits = goal.bits
+        self.offsets = {'up': -self.width, 'down': self.width, 'left': -1, 'right': 1}
+        self.goalIndex = [0] * self.size
+        for index, tile in enumerate(numbers):
+            self.goalIndex[tile] = index
+
+        self.misplaced = [[0] * self.size for tile in range(self.size)]
+        self.euclidean = [[0] * self.size for tile in range(self.size)]
+        self.manhattan = [[0] * self.size for tile in range(self.size)]
+        self.outOfLine = [[0] * self.size for tile in range(self.size)]
+        for tile in range(self.size):
+            goalRow, goalCol = divmod(self.goalIndex[tile], self.width)
+            for index in range(self.size):
+                row, col = divmod(index, self.width)
+                self.misplaced[tile][index] = int(numbers[index] != tile)
+                if tile != 0:
+                    self.euclidean[tile][index] = math.sqrt((row - goalRow) ** 2 + (col - goalCol) ** 2)
+                    self.manhattan[tile][index] = abs(row - goalRow) + abs(col - goalCol)
+                    self.outOfLine[tile][index] = int(row != goalRow) + int(col != goalCol)
+
+    def total(self, table, state):
+        "Sums table[tile][index] over the cells of 'state'."
+        board = state.board
+        mask = (1 << self.bits) - 1
+        total = 0
+        for index in range(self.size):
+            total += table[board & mask][index]
+            board >>= self.bits
+        return total
+
+_goalTablesCache = {}
+
+def goalTables(goal):
+    "Returns the GoalTables for 'goal', building them on first use."
+    tables = _goalTablesCache.get(goal)
+    if tables is None:
+        tables = _goalTablesCache[goal] = GoalTables(goal)
+    return tables
 
-    count = 0
-    for row in range(3):
-        for col in range(3):
-            if current_state.cells[row][col] == glstate.cells[row][col]:
-                count += 1
-    return 8-count
+def h1test(current_state, glstate):
+    # size - 1 less the number of cells, blank included, that match the goal
+    tables = goalTables(glstate)
+    return tables.total(tables.misplaced, current_state) - 1
 
 
 def h2test(current_state, glstate):
-    total_distance = 0
-    # Iterates through each tile
-    for row in range(3):
-        for col in range(3):
-            current_tile = current_state.cells[row][col]
-            if current_tile != 0:  # Skip the blank (empty) tile
-                # iterates through the goal state to check how far away the current tile is from its proper state
-                for goal_row in range(3):
-                    for goal_col in range(3):
-                        # subs the x and y coordinate of the goal state from the current state and finds the length of
-                        # the hypotonuse (sqrt(a^2+b^2) = c)
-                        if glstate.cells[goal_row][goal_col] == current_tile:
-                            distance = math.sqrt((row - goal_row) ** 2 + (col - goal_col) ** 2)
-                            total_distance += distance
-    return total_distance
+    # sum of the straight-line distances of the tiles from their goal places
+    tables = goalTables(glstate)
+    return tables.total(tables.euclidean, current_state)
 
 
 def h3test(current_state, glstate):
-    total_distance = 0
-    # iterates through each tile
-    for row in range(3):
-        for col in range(3):
-            current_tile = current_state.cells[row][col]
-            if current_tile != 0:
-                # iterates through the goal state to check how far away the current tile is from its proper state
-                for goal_row in range(3):
-                    for goal_col in range(3):
-                        # if the current tile belongs in the current goal state, the distance from the tile is set as
-                        # abs(X(current)-X(goal)) + abs(Y(current)-Y(goal))
-                        if glstate.cells[goal_row][goal_col] == current_tile:
-                            distance = abs(row - goal_row) + abs(col - goal_col)
-                            total_distance += distance
-    return total_distance
+    # sum of the Manhattan distances of the tiles from their goal places
+    tables = goalTables(glstate)
+    return tables.total(tables.manhattan, current_state)
 
 
 def h4test(current_state, glstate):
-    out_of_row_count = 0
-    out_of_col_count = 0
-
-    for row in range(3): # iterates through each tile
-        for col in range(3):
-            current_tile = current_state.cells[row][col] # sets the current tile
-            if current_tile != 0: # Skip the blank (empty) tile
-                inrow = 0
-                # Iterates though the column again to check if the current tile is in it, if so, adds one to the count
-                for c in range(3):
-                    if current_tile == glstate.cells[row][c]:
-                        inrow = 1
-                if inrow == 0:
-                    out_of_row_count +=1
-                # Iterates though the column again to check if the current tile is in it, if so, adds one to the count
-                incol = 0
-                for r in range(3):
-                    if current_tile == glstate.cells[r][col]:
-                        incol = 1
-                if incol == 0:
-                    out_of_col_count += 1
-
-    return out_of_row_count + out_of_col_count
+    # number of tiles out of their goal row plus number out of their goal column
+    tables = goalTables(glstate)
+    return tables.total(tables.outOfLine, current_state)
+
+class TableHeuristic:
+    """
+      A heuristic for one goal that sums a GoalTables table over the board.
+    Build it once and pass it as the heuristic to aStarSearch or
+    idaStarSearch: heuristic(state, problem) is one lookup per cell.
+    Subclasses name the table and a constant added to the sum.
+
+      childValue gives the value of every child without summing it again:
+
+    >>> import random, eightpuzzle
+    >>> rng = random.Random(0)
+    >>> for width in (3, 4):
+    ...     puzzle = eightpuzzle.puzzleClass(width)
+    ...     goal = puzzle(list(range(width * width)))
+    ...     states = [puzzle(rng.sample(range(width * width), width * width)) for i in range(200)]
+    ...     for heuristic in (MisplacedTilesHeuristic(goal), EuclideanHeuristic(goal),
+    ...                       ManhattanHeuristic(goal), OutOfRowColumnHeuristic(goal)):
+    ...         assert all(abs(heuristic.childValue(heuristic(s), s, move) - heuristic(s.result(move))) < 1e-9
+    ...                    for s in states for move in s.legalMoves())
+    """
+    tableName = None
+    offset = 0
+
+    def __init__(self, goal):
+        self.tables = goalTables(goal)
+        self.table = getattr(self.tables, self.tableName)
+
+    def __call__(self, state, problem=None):
+        return self.tables.total(self.table, state) + self.offset
+
+    def childValue(self, value, state, move):
+        """
+          Returns the value after the blank of 'state' makes 'move', given
+        the value before.  Only the moved tile and the blank change places,
+        so this is four lookups rather than a sum over the board.
+        """
+        table = self.table
+        blank = state.blank
+        target = blank + self.tables.offsets[move]
+        tile = state.tileAt(target)
+        return (value + table[tile][blank] + table[0][target]
+                - table[tile][target] - table[0][blank])
+
+class MisplacedTilesHeuristic(TableHeuristic):
+    "h1test as a heuristic object."
+    tableName = 'misplaced'
+    offset = -1
+
+class EuclideanHeuristic(TableHeuristic):
+    "h2test as a heuristic object."
+    tableName = 'euclidean'
+
+class ManhattanHeuristic(TableHeuristic):
+    "h3test as a heuristic object."
+    tableName = 'manhattan'
+
+class OutOfRowColumnHeuristic(TableHeuristic):
+    "h4test as a heuristic object."
+    tableName = 'outOfLine'
+
+def lineConflicts(goalPlaces):
+    """
+      goalPlaces: the goal places, along a row or column, of the tiles in
+    that line whose goal is in the same line, in board order.
+
+    Returns the fewest tiles that must leave the line for the rest to be in
+    goal order, which is the length of the sequence less its longest
+    increasing subsequence.  Each of those tiles needs two moves more than
+    its Manhattan distance.
+    """
+    longest = []
+    for i in range(len(goalPlaces)):
+        length = 1
+        for j in range(i):
+            if goalPlaces[j] < goalPlaces[i] and longest[j] + 1 > length:
+                length = longest[j] + 1
+        longest.append(length)
+    return len(goalPlaces) - max(longest + [0])
+
+class LinearConflictHeuristic:
+    """
+      Manhattan distance plus two moves for each tile that has to leave its
+    goal row or column to let other tiles in that line pass (see
+    lineConflicts).  Admissible, and never less than h3test.  childValue
+    re-examines only the two lines a move changes, and agrees with the full
+    evaluation:
+
+    >>> import random, eightpuzzle
+    >>> rng = random.Random(0)
+    >>> for width in (3, 4):
+    ...     puzzle = eightpuzzle.puzzleClass(width)
+    ...     goal = puzzle(list(range(width * width)))
+    ...     heuristic = LinearConflictHeuristic(goal)
+    ...     states = [puzzle(rng.sample(range(width * width), width * width)) for i in range(200)]
+    ...     assert all(heuristic.childValue(heuristic(s), s, move) == heuristic(s.result(move))
+    ...                for s in states for move in s.legalMoves())
+    """
+    def __init__(self, goal):
+        self.tables = goalTables(goal)
+        width = self.tables.width
+        self.goalRow = [index // width for index in self.tables.goalIndex]
+        self.goalCol = [index % width for index in self.tables.goalIndex]
+        self.rows = [list(range(row * width, (row + 1) * width)) for row in range(width)]
+        self.cols = [list(range(col, width * width, width)) for col in range(width)]
+
+    def rowConflicts(self, tiles, row):
+        "Conflicts among 'tiles', the contents of the given row in order."
+        goalRow, goalCol = self.goalRow, self.goalCol
+        return lineConflicts([goalCol[tile] for tile in tiles if tile != 0 and goalRow[tile] == row])
+
+    def colConflicts(self, tiles, col):
+        "Conflicts among 'tiles', the contents of the given column in order."
+        goalRow, goalCol = self.goalRow, self.goalCol
+        return lineConflicts([goalRow[tile] for tile in tiles if tile != 0 and goalCol[tile] == col])
+
+    def __call__(self, state, problem=None):
+        conflicts = 0
+        for row, indices in enumerate(self.rows):
+            conflicts += self.rowConflicts([state.tileAt(index) for index in indices], row)
+        for col, indices in enumerate(self.cols):
+            conflicts += self.colConflicts([state.tileAt(index) for index in indices], col)
+        return self.tables.total(self.tables.manhattan, state) + 2 * conflicts
+
+    def childValue(self, value, state, move):
+        """
+          Returns the value after the blank of 'state' makes 'move', given the
+        value before.  A vertical move takes a tile from one row to another
+        without changing the order of its column, and a horizontal move does
+        the same for columns, so only two lines are recounted.
+        """
+        width = self.tables.width
+        blank = state.blank
+        target = blank + self.tables.offsets[move]
+        tile = state.tileAt(target)
+        distances = self.tables.manhattan[tile]
+        value += distances[blank] - distances[target]
+
+        if move == 'up' or move == 'down':
+            lines, conflicts = (blank // width, target // width), self.rowConflicts
+            indices = self.rows
+        else:
+            lines, conflicts = (blank % width, target % width), self.colConflicts
+            indices = self.cols
+        for line in lines:
+            before = [state.tileAt(index) for index in indices[line]]
+            after = [tile if index == blank else 0 if index == target else before[i]
+                     for i, index in enumerate(indices[line])]
+            value += 2 * (conflicts(after, line) - conflicts(before, line))
+        return value
+
+class MaxHeuristic:
+    """
+      The largest value of several admissible heuristics, which is admissible
+    too.  The components are evaluated in the order given, so cheap ones
+    should come first: bounded(state, problem, limit), which idaStarSearch
+    uses, stops as soon as one exceeds 'limit', since the node is pruned
+    whatever the rest would say.
+
+      For each component it counts the calls, the evaluations where it gave
+    the maximum (ties go to the earlier component) and the time spent, so
+    report() shows whether an expensive component earns its cost.
+    """
+    def __init__(self, heuristics, names=None):
+        self.heuristics = list(heuristics)
+        self.names = names or [getattr(heuristic, '__name__', heuristic.__class__.__name__)
+                               for heuristic in self.heuristics]
+        self.calls = [0] * len(self.heuristics)
+        self.wins = [0] * len(self.heuristics)
+        self.times = [0.0] * len(self.heuristics)
+        self.cutoffs = 0
+
+    def bounded(self, state, problem, limit):
+        """
+          Returns the max of the components, or of those evaluated before one
+        exceeded 'limit'.
+        """
+        best, winner = -1, 0
+        last = len(self.heuristics) - 1
+        for i, heuristic in enumerate(self.heuristics):
+            start = time.perf_counter()
+            value = heuristic(state, problem)
+            self.times[i] += time.perf_counter() - start
+            self.calls[i] += 1
+            if value > best:
+                best, winner = value, i
+            if best > limit:
+                if i < last:
+                    self.cutoffs += 1
+                break
+        self.wins[winner] += 1
+        return best
+
+    def __call__(self, state, problem=None):
+        return self.bounded(state, problem, float('inf'))
+
+    def report(self):
+        "Prints the counters of each component."
+        print("%-28s %10s %10s %10s %10s" % ('component', 'calls', 'max', 'seconds', 'us/call'))
+        for name, calls, wins, seconds in zip(self.names, self.calls, self.wins, self.times):
+            print("%-28s %10d %10d %10.3f %10.2f" % (name, calls, wins, seconds, seconds * 1e6 / max(calls, 1)))
+        print("%d evaluations cut short at the bound" % self.cutoffs)
+
+class MemoizedHeuristic:
+    """
+      Wraps a heuristic with a util.LRUCache of its values, so that states
+    generated again are not evaluated again.  States are keyed by their
+    packed board unless a key function is given.  The cache never holds more
+    than maxSize values, and its hits and misses show whether it pays.  The
+    problem is passed on to the wrapped heuristic but is not part of the
+    key, so one memo should only serve problems with the same goal.
+
+    The wrapper has no childValue or bounded method, whatever the wrapped
+    heuristic has, so aStarSearch and idaStarSearch evaluate every state
+    through the cache instead of updating values incrementally.  Wrap only
+    heuristics that are dearer than a lookup.
+    """
+    def __init__(self, heuristic, maxSize=100000, key=None):
+        self.heuristic = heuristic
+        self.key = key
+        self.cache = util.LRUCache(maxSize)
+
+    def __call__(self, state, problem=None):
+        key = state.board if self.key is None else self.key(state)
+        value = self.cache.lookup(key)
+        if value is None:
+            value = self.heuristic(state, problem)
+            self.cache.store(key, value)
+        return value
+
+    def hits(self):
+        return self.cache.hits
+
+    def misses(self):
+        return self.cache.misses
 
 #*=====End Change Task 1 =====*/
 
 # Abbreviations
 bfs = breadthFirstSearch
+lbfs = layeredBreadthFirstSearch
+bibfs = bidirectionalSearch
 dfs = depthFirstSearch
 astar = aStarSearch
+idastar = idaStarSearch
+descent = greedyDescentSearch
+biastar = bidirectionalAStarSearch
 ucs = uniformCostSearch
@@ -26,9 +26,12 @@
 # Pieter Abbeel (pabbeel@cs.berkeley.edu).
 
 
+import os
 import sys
 import inspect
+import tempfile
 import heapq, random
+import collections
 from io import StringIO
 
 class FixedRandom:
@@ -151,18 +154,18 @@ class Stack:
 class Queue:
     "A container with a first-in-first-out (FIFO) queuing policy."
     def __init__(self):
-        self.list = []
+        self.list = collections.deque()
 
     def push(self,item):
         "Enqueue the 'item' into the queue"
-        self.list.insert(0,item)
+        self.list.append(item)
 
     def pop(self):
         """
           Dequeue the earliest enqueued item still in the queue. This
           operation removes the item from the queue.
         """
-        return self.list.pop()
+        return self.list.popleft()
 
     def isEmpty(self):
         "Returns true if the queue is empty"
@@ -191,6 +194,14 @@ class PriorityQueue:
     def isEmpty(self):
         return len(self.heap) == 0
 
+    def peek(self):
+        "Returns the lowest-priority item without removing it"
+        return self.heap[0][2]
+
+    def minPriority(self):
+        "Returns the priority of the lowest-priority item"
+        return self.heap[0][0]
+
     def update(self, item, priority):
         # If item already in priority queue with higher priority, update its priority and rebuild the heap.
         # If item already in priority queue with equal or lower priority, do nothing.
@@ -206,6 +217,148 @@ class PriorityQueue:
         else:
             self.push(item, priority)
 
+class KeyedPriorityQueue:
+    """
+      A priority queue holding at most one item per key, where the key of an
+    item is keyFunction(item) (the item itself by default).  The binary heap
+    keeps an index from each key to its position, so membership tests are
+    O(1) and update() -- a decrease-key -- is O(log n).  push, pop, isEmpty
+    and update have the same signatures as in PriorityQueue.
+
+    >>> q = KeyedPriorityQueue()
+    >>> for item, priority in [('a', 5), ('b', 3), ('c', 4), ('d', 1)]:
+    ...     q.push(item, priority)
+    >>> q.update('a', 2)        # decrease-key
+    >>> q.update('b', 9)        # already queued with a lower priority
+    >>> 'c' in q, 'e' in q, len(q)
+    (True, False, 4)
+    >>> [q.pop() for i in range(len(q))], 'a' in q
+    (['d', 'a', 'b', 'c'], False)
+
+    push replaces an item with the same key whatever its priority:
+
+    >>> q = KeyedPriorityQueue(lambda pair: pair[0])
+    >>> q.push(('x', 1), 1); q.push(('y', 2), 2); q.push(('x', 3), 3)
+    >>> q.pop(), q.pop(), q.isEmpty()
+    (('y', 2), ('x', 3), True)
+
+    Interleaved updates and pops agree with a dictionary of priorities:
+
+    >>> r = random.Random(0)
+    >>> q, queued = KeyedPriorityQueue(), {}
+    >>> for i in range(5000):
+    ...     if queued and r.random() < 0.3:
+    ...         lowest = min(queued.values())
+    ...         assert queued.pop(q.pop()) == lowest
+    ...     else:
+    ...         key, priority = r.randrange(100), r.randrange(1000)
+    ...         q.update(key, priority)
+    ...         queued[key] = min(queued.get(key, priority), priority)
+    >>> len(q) == len(queued), all(key in q for key in queued)
+    (True, True)
+    """
+    def  __init__(self, keyFunction=None):
+        # entries are [priority, count, key, item]; counts are unique, so
+        # entries order by (priority, count) and never compare keys or items
+        self.heap = []
+        self.index = {}     # key -> position of its entry in self.heap
+        self.count = 0
+        self.keyFunction = keyFunction
+
+    def __key(self, item):
+        if self.keyFunction is None:
+            return item
+        return self.keyFunction(item)
+
+    def push(self, item, priority):
+        "Queues 'item', replacing any item with the same key whatever its priority"
+        key = self.__key(item)
+        if key in self.index:
+            position = self.index[key]
+            entry = self.heap[position]
+            oldPriority = entry[0]
+            entry[0], entry[3] = priority, item
+            if priority < oldPriority:
+                self.__siftUp(position)
+            else:
+                self.__siftDown(position)
+            return
+        self.heap.append([priority, self.count, key, item])
+        self.index[key] = len(self.heap) - 1
+        self.count += 1
+        self.__siftUp(len(self.heap) - 1)
+
+    def pop(self):
+        heap = self.heap
+        last = heap.pop()
+        if heap:
+            entry = heap[0]
+            heap[0] = last
+            self.index[last[2]] = 0
+            self.__siftDown(0)
+        else:
+            entry = last
+        del self.index[entry[2]]
+        return entry[3]
+
+    def isEmpty(self):
+        return len(self.heap) == 0
+
+    def update(self, item, priority):
+        # If an item with the same key is queued with higher priority, replace it and move it up.
+        # If an item with the same key is queued with equal or lower priority, do nothing.
+        # If no item with that key is queued, do the same thing as self.push.
+        key = self.__key(item)
+        position = self.index.get(key)
+        if position is None:
+            self.push(item, priority)
+            return
+        entry = self.heap[position]
+        if entry[0] <= priority:
+            return
+        entry[0], entry[3] = priority, item
+        self.__siftUp(position)
+
+    def __contains__(self, item):
+        return self.__key(item) in self.index
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __siftUp(self, position):
+        heap, index = self.heap, self.index
+        entry = heap[position]
+        while position > 0:
+            parentPosition = (position - 1) >> 1
+            parent = heap[parentPosition]
+            if entry >= parent:
+                break
+            heap[position] = parent
+            index[parent[2]] = position
+            position = parentPosition
+        heap[position] = entry
+        index[entry[2]] = position
+
+    def __siftDown(self, position):
+        heap, index = self.heap, self.index
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            childPosition = 2 * position + 1
+            if childPosition >= size:
+                break
+            child = heap[childPosition]
+            if childPosition + 1 < size and heap[childPosition + 1] < child:
+                childPosition += 1
+                child = heap[childPosition]
+            if entry <= child:
+                break
+            heap[position] = child
+            index[child[2]] = position
+            position = childPosition
+        heap[position] = entry
+        index[entry[2]] = position
+
 class PriorityQueueWithFunction(PriorityQueue):
     """
     Implements a priority queue with the same push/pop signature of the
@@ -223,6 +376,102 @@ class PriorityQueueWithFunction(PriorityQueue):
         PriorityQueue.push(self, item, self.priorityFunction(item))
 
 
+class Bitset:
+    """
+      A fixed-size set of the integers 0..size-1, stored one bit per member.
+    Membership tests and insertions are O(1).
+
+    >>> s = Bitset(20)
+    >>> s.add(3); s.add(17); s.add(3)
+    >>> 3 in s, 17 in s, 4 in s, len(s)
+    (True, True, False, 2)
+    """
+    def __init__(self, size):
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+        self.count = 0
+
+    def add(self, index):
+        "Adds 'index' to the set"
+        mask = 1 << (index & 7)
+        if not self.bits[index >> 3] & mask:
+            self.bits[index >> 3] |= mask
+            self.count += 1
+
+    def __contains__(self, index):
+        return (self.bits[index >> 3] >> (index & 7)) & 1 == 1
+
+    def __len__(self):
+        return self.count
+
+class LRUCache:
+    """
+      A dictionary of at most maxSize entries that drops the least recently
+    used entry to make room.  lookup() counts its hits and misses.
+
+    >>> cache = LRUCache(2)
+    >>> cache.store('a', 1); cache.store('b', 2)
+    >>> cache.lookup('a')
+    1
+    >>> cache.store('c', 3)     # evicts 'b', used longest ago
+    >>> cache.lookup('b'), cache.lookup('c'), len(cache)
+    (None, 3, 2)
+    >>> cache.hits, cache.misses
+    (2, 1)
+    """
+    def __init__(self, maxSize):
+        self.maxSize = maxSize
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key, default=None):
+        "Returns the value stored for 'key', or 'default' if there is none"
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return default
+
+    def store(self, key, value):
+        "Stores 'value' for 'key', evicting the oldest entry if full"
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxSize:
+            entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.entries)
+
+def writeAtomically(path, data):
+    """
+      Writes the bytes 'data' to 'path' through a temporary file in the same
+    directory, which is then renamed over 'path'.  Readers see the old file
+    or the whole new one, never a partly written one, and a save that is
+    interrupted leaves no file behind.
+
+    >>> directory = tempfile.mkdtemp()
+    >>> path = os.path.join(directory, 'table')
+    >>> writeAtomically(path, b'abc')
+    >>> open(path, 'rb').read(), os.listdir(directory)
+    (b'abc', ['table'])
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    handle, temporary = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                         dir=directory or '.')
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            file.write(data)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
 def manhattanDistance( xy1, xy2 ):
     "Returns the Manhattan distance between points xy1 and xy2"
     return abs( xy1[0] - xy2[0] ) + abs( xy1[1] - xy2[1] )